@@ -0,0 +1,25 @@
+"""
+Benchmarks for the search players. Run them from the repository root, e.g. python -m benchmarks.move_ordering
+"""
+import random
+
+def random_positions(new_game, num_positions: int, num_moves: int, seed: int = 0):
+    """
+    Play random moves from the empty board to get unfinished positions.
+    :param new_game: callable returning an empty game
+    :param num_positions: number of positions
+    :param num_moves: number of random moves per position
+    :param seed: random seed, so every run measures the same positions
+    :return: list of games
+    """
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < num_positions:
+        game = new_game()
+        for _ in range(num_moves):
+            game.push(rng.choice(game.empty_cells()))
+            if game.game_over():
+                break
+        if not game.game_over():
+            positions.append(game)
+    return positions
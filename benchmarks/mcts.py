@@ -0,0 +1,62 @@
+"""
+Simulations per second, tree size and memory of TTT_MCTSPlayer's engines, and simulations per second with batched rollouts.
+Each configuration searches the same position a few times and the best rate is reported, to reduce timing noise.
+The rate counts the simulations that were run, which can be fewer than num_simulations when the solver stops early.
+"""
+import time
+import tracemalloc
+from project.game import TicTacToe, Gomoku
+from project.tictactoe import TTT_MCTSPlayer
+from project.tictactoe.mcts import ENGINES
+
+REPEATS = 3
+ROLLOUTS = [1, 8, 32, 128] # Rollouts per leaf on Tic Tac Toe
+
+def first_move(game):
+    game.push((game.m // 2, game.n // 2))
+    return game
+
+BOARDS = [
+    ('Tic Tac Toe, empty board', TicTacToe, 5000),
+    ('Gomoku, one stone in the centre', lambda: first_move(Gomoku()), 300),
+]
+
+def simulations_per_second(new_game, num_simulations, **kwargs):
+    best = 0
+    for _ in range(REPEATS):
+        game = new_game()
+        player = TTT_MCTSPlayer(game.curr_player, num_simulations=num_simulations, **kwargs)
+        start = time.perf_counter()
+        player.get_move(game)
+        best = max(best, player.simulations / (time.perf_counter() - start))
+    return best
+
+def peak_memory(new_game, num_simulations, **kwargs):
+    """
+    :return: (peak memory in bytes, nodes in the tree)
+    """
+    game = new_game()
+    player = TTT_MCTSPlayer(game.curr_player, num_simulations=num_simulations, **kwargs)
+    tracemalloc.start()
+    player.get_move(game)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, player.new_nodes
+
+if __name__ == '__main__':
+    for name, new_game, num_simulations in BOARDS:
+        print(f"\n**{name}** ({num_simulations} simulations)\n")
+        print("| Engine | Simulations/s | Nodes | Peak memory |")
+        print("|---|---|---|---|")
+        for engine in ENGINES:
+            rate = simulations_per_second(new_game, num_simulations, engine=engine)
+            memory, nodes = peak_memory(new_game, num_simulations, engine=engine)
+            print(f"| {engine} | {rate:.0f} | {nodes} | {memory / 2**20:.1f} MiB |")
+
+    num_simulations = BOARDS[0][2]
+    print(f"\n**Tic Tac Toe, batched rollouts** ({num_simulations} simulations)\n")
+    print("| Rollouts per leaf | " + " | ".join(f"{engine} simulations/s" for engine in ENGINES) + " |")
+    print("|---|" + "---|" * len(ENGINES))
+    for rollouts in ROLLOUTS:
+        rates = [simulations_per_second(TicTacToe, num_simulations, engine=engine, rollouts=rollouts) for engine in ENGINES]
+        print(f"| {rollouts} | " + " | ".join(f"{rate:.0f}" for rate in rates) + " |")
@@ -0,0 +1,45 @@
+"""
+Node counts of TTT_AlphaBetaPlayer with different move ordering heuristics, to show the pruning gain.
+Each position is searched by a fresh player, so only the ordering within one search is measured.
+"""
+from project.game import TicTacToe, MNKGame
+from project.tictactoe import TTT_AlphaBetaPlayer
+from . import random_positions
+
+CONFIGS = [
+    ('row-major, no TT', 0, ()),
+    ('row-major', None, ()),
+    ('static', None, ('static',)),
+    ('tt', None, ('tt',)),
+    ('tt + killer', None, ('tt', 'killer')),
+    ('tt + killer + history', None, ('tt', 'killer', 'history')),
+    ('all', None, ('tt', 'killer', 'history', 'static')),
+]
+
+BOARDS = [
+    ('3x3, 1 move played', TicTacToe, 1),
+    ('4x4 k=4, 6 moves played', lambda: MNKGame(4, 4, 4), 6),
+]
+
+def count_nodes(positions, tt_size, heuristics):
+    nodes = 0
+    for game in positions:
+        kwargs = {'move_ordering': heuristics}
+        if tt_size is not None:
+            kwargs['tt_size'] = tt_size
+        player = TTT_AlphaBetaPlayer(game.curr_player, **kwargs)
+        player.get_move(game)
+        nodes += player.nodes
+    return nodes
+
+if __name__ == '__main__':
+    for name, new_game, num_moves in BOARDS:
+        positions = random_positions(new_game, 20, num_moves)
+        print(f"\n**{name}** ({len(positions)} positions)\n")
+        print("| Ordering | Nodes | vs row-major, no TT |")
+        print("|---|---|---|")
+        baseline = None
+        for label, tt_size, heuristics in CONFIGS:
+            nodes = count_nodes(positions, tt_size, heuristics)
+            baseline = baseline or nodes
+            print(f"| {label} | {nodes} | {baseline / nodes:.1f}x |")
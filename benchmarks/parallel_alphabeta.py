@@ -0,0 +1,39 @@
+"""
+Time of TTT_AlphaBetaPlayer's root-parallel search with different numbers of worker processes.
+Gomoku positions are searched to a fixed depth, so every run does comparable work. Worker start-up is not timed.
+"""
+import os
+import time
+from project.game import Gomoku
+from project.evaluation import PatternEvaluator
+from project.tictactoe import TTT_AlphaBetaPlayer
+from . import random_positions
+
+WORKERS = [1, 2, 4, 8]
+DEPTH = 3
+
+def search_time(positions, workers):
+    player = TTT_AlphaBetaPlayer('X', max_depth=DEPTH, workers=workers)
+    # Warm up the worker processes outside the timed loop
+    player.get_move(positions[0])
+    player.nodes = 0
+    elapsed = 0
+    for game in positions:
+        player.letter = game.curr_player
+        search_game = game.copy()
+        search_game.evaluator = PatternEvaluator(search_game)
+        player.ordering.new_search()
+        start = time.perf_counter()
+        player.search(search_game, DEPTH)
+        elapsed += time.perf_counter() - start
+    player.close()
+    return elapsed, player.nodes
+
+if __name__ == '__main__':
+    positions = random_positions(Gomoku, 10, 10)
+    print(f"\n**Gomoku, 10 moves played, depth {DEPTH}** ({len(positions)} positions, CPU cores: {os.cpu_count()})\n")
+    print("| Workers | Time | Nodes |")
+    print("|---|---|---|")
+    for workers in WORKERS:
+        elapsed, nodes = search_time(positions, workers)
+        print(f"| {workers} | {elapsed:.2f}s | {nodes} |")
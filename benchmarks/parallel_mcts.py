@@ -0,0 +1,33 @@
+"""
+Simulations per second of TTT_MCTSPlayer's root- and leaf-parallel modes with different numbers of worker processes.
+Worker start-up is not timed. The rate counts the simulations that were run, which can be fewer than NUM_SIMULATIONS when
+the solver stops early.
+"""
+import os
+import time
+from project.game import TicTacToe
+from project.tictactoe import TTT_MCTSPlayer
+from project.tictactoe.mcts import PARALLEL_MODES
+
+WORKERS = [1, 2, 4, 8]
+NUM_SIMULATIONS = 5000
+REPEATS = 3
+
+def simulations_per_second(workers, parallel):
+    player = TTT_MCTSPlayer('X', num_simulations=NUM_SIMULATIONS, reuse_tree=False, workers=workers, parallel=parallel)
+    player.get_move(TicTacToe()) # Warm up the worker processes
+    best = 0
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        player.get_move(TicTacToe())
+        best = max(best, player.simulations / (time.perf_counter() - start))
+    player.close()
+    return best
+
+if __name__ == '__main__':
+    print(f"\n**Tic Tac Toe, empty board** ({NUM_SIMULATIONS} simulations, CPU cores: {os.cpu_count()})\n")
+    print("| Workers | " + " | ".join(f"{mode} simulations/s" for mode in PARALLEL_MODES) + " |")
+    print("|---|" + "---|" * len(PARALLEL_MODES))
+    for workers in WORKERS:
+        rates = [simulations_per_second(workers, mode) for mode in PARALLEL_MODES]
+        print(f"| {workers} | " + " | ".join(f"{rate:.0f}" for rate in rates) + " |")
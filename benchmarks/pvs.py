@@ -0,0 +1,41 @@
+"""
+Node counts of TTT_AlphaBetaPlayer with plain alpha-beta, principal variation search and aspiration windows.
+Every search uses iterative deepening without a time limit, so all configurations search the same depths and find the same scores.
+"""
+import math
+from project.game import MNKGame, Gomoku
+from project.tictactoe import TTT_AlphaBetaPlayer
+from . import random_positions
+
+CONFIGS = [
+    ('alpha-beta', {}),
+    ('PVS', {'pvs': True, 'aspiration_window': None}),
+    ('PVS + aspiration', {'pvs': True}),
+]
+
+BOARDS = [
+    ('4x4 k=4, 6 moves played', lambda: MNKGame(4, 4, 4), 6, None),
+    ('Gomoku, 10 moves played, depth 3', Gomoku, 10, 3),
+]
+
+def count_nodes(positions, max_depth, kwargs):
+    nodes = re_searches = aspiration_fails = 0
+    for game in positions:
+        player = TTT_AlphaBetaPlayer(game.curr_player, time_limit=math.inf, max_depth=max_depth, **kwargs)
+        player.get_move(game)
+        nodes += player.nodes
+        re_searches += player.re_searches
+        aspiration_fails += player.aspiration_fails
+    return nodes, re_searches, aspiration_fails
+
+if __name__ == '__main__':
+    for name, new_game, num_moves, max_depth in BOARDS:
+        positions = random_positions(new_game, 10, num_moves)
+        print(f"\n**{name}** ({len(positions)} positions)\n")
+        print("| Search | Nodes | Re-searches | Aspiration fails | vs alpha-beta |")
+        print("|---|---|---|---|---|")
+        baseline = None
+        for label, kwargs in CONFIGS:
+            nodes, re_searches, aspiration_fails = count_nodes(positions, max_depth, kwargs)
+            baseline = baseline or nodes
+            print(f"| {label} | {nodes} | {re_searches} | {aspiration_fails} | {baseline / nodes:.2f}x |")
@@ -0,0 +1,72 @@
+"""
+Playing strength of TTT_MCTSPlayer with RAVE against the plain player, by number of simulations.
+* Share of optimal moves by the perfect-play table, on random positions with 0 to 5 stones.
+* Games of the two players against each other at equal numbers of simulations, with alternating letters.
+"""
+import random
+from project.game import TicTacToe
+from project.tictactoe import TTT_MCTSPlayer
+from project.tictactoe.oracle import lookup
+from . import random_positions
+
+SIMULATIONS = [25, 50, 100, 200, 400]
+POSITIONS_PER_DEPTH = 60
+NUM_GAMES = 100
+SEED = 0
+
+def optimal_share(positions, num_simulations, **kwargs):
+    """
+    Share of the positions in which a fresh player picks an optimal move.
+    """
+    random.seed(SEED)
+    optimal = 0
+    for game in positions:
+        player = TTT_MCTSPlayer(game.curr_player, num_simulations, **kwargs)
+        optimal += list(player.get_move(game)) in lookup(game)[1]
+    return optimal / len(positions)
+
+def play(players, optimal, moves):
+    """
+    Play one game and count the optimal moves of every player by name.
+    :param players: {letter: (name, player)}
+    """
+    game = TicTacToe()
+    while not game.game_over():
+        name, player = players[game.curr_player]
+        move = player.get_move(game)
+        optimal[name] += list(move) in lookup(game)[1]
+        moves[name] += 1
+        game.push(tuple(move))
+    return players[game.winner][0] if game.winner else None
+
+def compare(num_simulations, **rave_kwargs):
+    """
+    :return: ({'rave': wins, 'plain': wins, None: draws}, {'rave': optimal share, 'plain': optimal share})
+    """
+    random.seed(SEED)
+    results = {'rave': 0, 'plain': 0, None: 0}
+    optimal = {'rave': 0, 'plain': 0}
+    moves = {'rave': 0, 'plain': 0}
+    for i in range(NUM_GAMES):
+        rave_letter, plain_letter = ('X', 'O') if i % 2 == 0 else ('O', 'X')
+        players = {
+            rave_letter: ('rave', TTT_MCTSPlayer(rave_letter, num_simulations, rave=True, **rave_kwargs)),
+            plain_letter: ('plain', TTT_MCTSPlayer(plain_letter, num_simulations)),
+        }
+        results[play(players, optimal, moves)] += 1
+    return results, {name: optimal[name] / moves[name] for name in optimal}
+
+if __name__ == '__main__':
+    positions = [game for num_moves in range(6) for game in random_positions(TicTacToe, POSITIONS_PER_DEPTH, num_moves, seed=num_moves)]
+    print(f"\n**Tic Tac Toe, optimal moves** ({len(positions)} random positions)\n")
+    print("| Simulations | Plain | RAVE |")
+    print("|---|---|---|")
+    for num_simulations in SIMULATIONS:
+        print(f"| {num_simulations} | {optimal_share(positions, num_simulations):.1%} | {optimal_share(positions, num_simulations, rave=True):.1%} |")
+
+    print(f"\n**Tic Tac Toe, RAVE vs plain UCB1** ({NUM_GAMES} games per row)\n")
+    print("| Simulations | RAVE wins | Draws | Plain wins | RAVE optimal moves | Plain optimal moves |")
+    print("|---|---|---|---|---|---|")
+    for num_simulations in SIMULATIONS:
+        results, optimal = compare(num_simulations)
+        print(f"| {num_simulations} | {results['rave']} | {results[None]} | {results['plain']} | {optimal['rave']:.1%} | {optimal['plain']:.1%} |")
@@ -1,44 +1,73 @@
-from .game import TicTacToe
-from .tictactoe import TTT_HumanPlayer, TTT_MinimaxPlayer, TTT_AlphaBetaPlayer, TTT_MCTSPlayer, TTT_QPlayer
-from .player import RandomPlayer
-
-def Game(game):
-    if game == 'tictactoe':
-        game = TicTacToe()
-    else:
-        raise ValueError("Invalid game. Please choose between 'tictactoe' and 'gomoku'")
-    return game
-
-def Player(player1, player2):
-    if player1 == 'random':
-        x_player = RandomPlayer('X')
-    elif player1 == 'human':
-        x_player = TTT_HumanPlayer('X')
-    elif player1 == 'minimax':
-        x_player = TTT_MinimaxPlayer('X')
-    elif player1 == 'alphabeta':
-        x_player = TTT_AlphaBetaPlayer('X')
-    elif player1 == 'mcts':
-        x_player = TTT_MCTSPlayer('X')
-    elif player1 == 'qplayer':
-        x_player = TTT_QPlayer('X')
-    else:
-        raise ValueError(f"Player 1 {player1} is not defined.")
-    
-    if player2 == 'random':
-        o_player = RandomPlayer('O')
-    elif player2 == 'human':
-        o_player = TTT_HumanPlayer('O')
-    elif player2 == 'minimax':
-        o_player = TTT_MinimaxPlayer('O')
-    elif player2 == 'alphabeta':
-        o_player = TTT_AlphaBetaPlayer('O')
-    elif player2 == 'mcts':
-        o_player = TTT_MCTSPlayer('O')
-    elif player2 == 'qplayer':
-        o_player = TTT_QPlayer('O')
-    else:
-        raise ValueError(f"Player 2 {player2} is not defined.")
-            
-    
-    return x_player, o_player
+from .game import TicTacToe, MNKGame, Gomoku
+from .tictactoe import TTT_HumanPlayer, TTT_MinimaxPlayer, TTT_AlphaBetaPlayer, TTT_MCTSPlayer, TTT_QPlayer, TTT_OraclePlayer
+from .gomoku import GMK_HumanPlayer
+from .player import RandomPlayer
+
+def Game(game):
+    if game == 'tictactoe':
+        game = TicTacToe()
+    elif game == 'gomoku':
+        game = Gomoku()
+    else:
+        raise ValueError("Invalid game. Please choose between 'tictactoe' and 'gomoku'")
+    return game
+
+# Share of the move timeout that the iterative-deepening and anytime MCTS searches may use, leaving time to return the move
+TIME_LIMIT_SHARE = 0.8
+GMK_TIME_LIMIT = 10 # Seconds per move for Gomoku search without a timeout
+
+def Player(player1, player2, game='tictactoe', timeout=None, workers=1, anytime=False):
+    if game == 'gomoku':
+        return _gomoku_player(player1, 'X', timeout, workers), _gomoku_player(player2, 'O', timeout, workers)
+    
+    time_limit = TIME_LIMIT_SHARE * timeout if timeout is not None else None
+    # MCTS runs a fixed number of simulations unless it is asked to use the time limit
+    mcts_time_limit = time_limit if anytime else None
+    
+    if player1 == 'random':
+        x_player = RandomPlayer('X')
+    elif player1 == 'human':
+        x_player = TTT_HumanPlayer('X')
+    elif player1 == 'minimax':
+        x_player = TTT_MinimaxPlayer('X')
+    elif player1 == 'alphabeta':
+        x_player = TTT_AlphaBetaPlayer('X', time_limit=time_limit, workers=workers)
+    elif player1 == 'mcts':
+        x_player = TTT_MCTSPlayer('X', workers=workers, time_limit=mcts_time_limit)
+    elif player1 == 'qplayer':
+        x_player = TTT_QPlayer('X')
+    elif player1 == 'oracle':
+        x_player = TTT_OraclePlayer('X')
+    else:
+        raise ValueError(f"Player 1 {player1} is not defined.")
+    
+    if player2 == 'random':
+        o_player = RandomPlayer('O')
+    elif player2 == 'human':
+        o_player = TTT_HumanPlayer('O')
+    elif player2 == 'minimax':
+        o_player = TTT_MinimaxPlayer('O')
+    elif player2 == 'alphabeta':
+        o_player = TTT_AlphaBetaPlayer('O', time_limit=time_limit, workers=workers)
+    elif player2 == 'mcts':
+        o_player = TTT_MCTSPlayer('O', workers=workers, time_limit=mcts_time_limit)
+    elif player2 == 'qplayer':
+        o_player = TTT_QPlayer('O')
+    elif player2 == 'oracle':
+        o_player = TTT_OraclePlayer('O')
+    else:
+        raise ValueError(f"Player 2 {player2} is not defined.")
+            
+    
+    return x_player, o_player
+
+def _gomoku_player(player, letter, timeout=None, workers=1):
+    if player == 'random':
+        return RandomPlayer(letter)
+    elif player == 'human':
+        return GMK_HumanPlayer(letter)
+    elif player == 'alphabeta':
+        # The board is too large to search to the end, so Gomoku always searches with iterative deepening and PVS
+        return TTT_AlphaBetaPlayer(letter, time_limit=TIME_LIMIT_SHARE * (timeout or GMK_TIME_LIMIT), workers=workers, pvs=True)
+    else:
+        raise ValueError(f"Player {player} is not available for Gomoku. Please choose between 'random', 'human' and 'alphabeta'")
@@ -0,0 +1,134 @@
+"""
+This module contains BatchTicTacToe, a vectorised environment that steps many Tic Tac Toe boards at once with NumPy.
+* Boards use the same cell values as MNKGame (0 empty, 1 'X', 2 'O') and the cell index 3*x + y of the bitboards.
+* It is meant for high-throughput rollouts and training, not for GamePlay; use TicTacToe for a single game.
+"""
+from typing import Optional, Tuple
+import numpy as np
+from .game import TicTacToe, WIN_COMBOS, STONES, EMPTY
+
+# (8, 3) cell indices of the win lines
+WIN_LINES = np.array([[3*x + y for x, y in combo] for combo in WIN_COMBOS], dtype=np.intp)
+
+class BatchTicTacToe():
+    def __init__(self, num_games: int, auto_reset: bool = True, seed: Optional[int] = None):
+        """
+        Hold num_games boards in one (num_games, 9) array.
+        :param num_games: number of boards in the batch
+        :param auto_reset: restart boards as soon as their game is over
+        :param seed: seed for random_moves()
+        """
+        self.num_games = num_games
+        self.auto_reset = auto_reset
+        self.rng = np.random.default_rng(seed)
+        self.boards = np.zeros((num_games, 9), dtype=np.int8)
+        self.curr_player = np.full(num_games, STONES['X'], dtype=np.int8)
+        self.num_moves = np.zeros(num_games, dtype=np.int8)
+        self.winners = np.zeros(num_games, dtype=np.int8)
+        self.done = np.zeros(num_games, dtype=bool)
+        self.games_finished = 0
+
+    @classmethod
+    def from_game(cls, game: TicTacToe, num_games: int, auto_reset: bool = False, seed: Optional[int] = None) -> 'BatchTicTacToe':
+        """
+        Create a batch where every board is a copy of the current state of a game.
+        :param game: Tic Tac Toe game to copy
+        :param num_games: number of copies
+        :return: the batch environment
+        """
+        batch = cls(num_games, auto_reset=auto_reset, seed=seed)
+        batch.load(game)
+        return batch
+
+    def load(self, game: TicTacToe):
+        """
+        Set every board of the batch to the current state of a game.
+        """
+        board = np.array([STONES[v] if v else EMPTY for row in game.board_state for v in row], dtype=np.int8)
+        self.boards[:] = board
+        self.curr_player[:] = STONES[game.curr_player]
+        self.num_moves[:] = game.num_moves
+        self.winners[:] = STONES[game.winner] if game.winner else 0
+        self.done[:] = game.game_over()
+
+    def reset(self, mask: Optional[np.ndarray] = None):
+        """
+        Restart the boards selected by a boolean mask (all boards if mask is None).
+        """
+        if mask is None:
+            mask = np.ones(self.num_games, dtype=bool)
+        self.boards[mask] = EMPTY
+        self.curr_player[mask] = STONES['X']
+        self.num_moves[mask] = 0
+        self.winners[mask] = 0
+        self.done[mask] = False
+
+    def legal_moves(self) -> np.ndarray:
+        """
+        Legal-move mask of the batch. Finished boards have no legal moves.
+        :return: (num_games, 9) boolean array
+        """
+        return (self.boards == EMPTY) & ~self.done[:, None]
+
+    def random_moves(self) -> np.ndarray:
+        """
+        Sample one uniformly random legal move per board, or -1 for finished boards.
+        :return: (num_games,) array of cell indices
+        """
+        legal = self.legal_moves()
+        moves = np.argmax(self.rng.random(legal.shape) * legal, axis=1)
+        moves[~legal.any(axis=1)] = -1
+        return moves
+
+    def step(self, moves: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Play one move on every unfinished board and check the win lines of the players who moved.
+        :param moves: (num_games,) array of cell indices 3*x + y; entries of finished boards are ignored
+        :return: (winners, done) of this step, before any auto-reset. winners holds 0 (none/draw), 1 ('X') or 2 ('O')
+        """
+        active = np.flatnonzero(~self.done)
+        cells = np.asarray(moves)[active]
+        if np.any(cells < 0) or np.any(cells > 8) or np.any(self.boards[active, cells] != EMPTY):
+            raise ValueError("Invalid move in batch. Every unfinished board needs an empty cell index 0..8")
+
+        player = self.curr_player[active]
+        self.boards[active, cells] = player
+        self.num_moves[active] += 1
+
+        # Only the player who just moved can have completed a line
+        lines = self.boards[active][:, WIN_LINES]
+        won = (lines == player[:, None, None]).all(axis=2).any(axis=1)
+        self.winners[active[won]] = player[won]
+        self.done[active] = won | (self.num_moves[active] == 9)
+        self.curr_player[active] = 3 - player
+
+        winners, done = self.winners.copy(), self.done.copy()
+        if self.auto_reset and done.any():
+            self.games_finished += int(done.sum())
+            self.reset(done)
+        return winners, done
+
+    def random_playouts(self) -> np.ndarray:
+        """
+        Winners of one uniformly random play-out of every board, e.g. for MCTS rollouts. The batch itself is not changed.
+        Instead of stepping move by move, every board draws a random order of its empty cells at once:
+        the players fill them alternately in that order, and the game ends with the first line that is completed.
+        :return: (num_games,) winners, 0 (draw), 1 ('X') or 2 ('O')
+        """
+        empty = self.boards == EMPTY
+        keys = self.rng.random(self.boards.shape)
+        keys[~empty] = -1.0 # Stones on the board come first in the order
+        order = np.argsort(keys, axis=1)
+        turn = np.empty_like(order)
+        np.put_along_axis(turn, order, np.arange(9), axis=1)
+        turn -= 9 - empty.sum(axis=1, keepdims=True) # 0 for the first move of the play-out, negative for stones already on the board
+
+        player = self.curr_player[:, None]
+        owner = np.where(empty, np.where(turn % 2 == 0, player, 3 - player), self.boards)
+        lines = owner[:, WIN_LINES]
+        complete = (lines == lines[:, :, :1]).all(axis=2)
+        finished_at = np.where(complete, turn[:, WIN_LINES].max(axis=2), 9) # A line is completed by its last stone
+        first = finished_at.argmin(axis=1)
+        rows = np.arange(self.num_games)
+        winners = np.where(finished_at[rows, first] < 9, lines[rows, first, 0], 0).astype(np.int8)
+        return np.where(self.done, self.winners, winners)
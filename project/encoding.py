@@ -0,0 +1,77 @@
+"""
+This module contains the compact state encoding shared by process pools, game logs and persisted tables.
+* 3x3 Tic Tac Toe boards are encoded as a base-3 integer: sum of value(cell) * 3**cell with cell = 3*x + y.
+* Larger m,n,k boards are encoded as bytes: a 3-byte header (m, n, k) followed by 2 bits per cell, 4 cells per byte.
+* Cell values are the MNKGame ones (0 empty, 1 'X', 2 'O'). The side to move is not stored, since 'X' always moves first.
+"""
+from typing import Optional, Union
+import numpy as np
+from .game import Game, TicTacToe, MNKGame, Gomoku, FULL_MASK, STONES
+
+NUM_TTT_STATES = 3 ** 9
+POWERS_OF_3 = 3 ** np.arange(9, dtype=np.int64)
+
+# Base-3 value of every 9-bit mask with a 1 digit on each set bit, so a bitboard pair encodes with two lookups
+BASE3_OF_MASK = [sum(3 ** i for i in range(9) if mask >> i & 1) for mask in range(FULL_MASK + 1)]
+
+def encode(game: Game) -> Union[int, bytes]:
+    """
+    Encode the board of a game.
+    :param game: TicTacToe or MNKGame
+    :return: base-3 integer for Tic Tac Toe, packed bytes for larger boards
+    """
+    if isinstance(game, TicTacToe):
+        return BASE3_OF_MASK[game.x_bits] + 2 * BASE3_OF_MASK[game.o_bits]
+    header = bytes([game.m, game.n, game.k])
+    return header + encode_batch(game.board.reshape(1, -1), packed=True)[0].tobytes()
+
+def decode(code: Union[int, bytes]) -> Game:
+    """
+    Rebuild a game from its encoding. Winner, move count, side to move and hash key are recomputed.
+    :param code: output of encode()
+    :return: TicTacToe for an integer, MNKGame (Gomoku for square boards) for bytes
+    """
+    if isinstance(code, (bytes, bytearray)):
+        m, n, k = code[0], code[1], code[2]
+        game = Gomoku(m, k) if m == n else MNKGame(m, n, k)
+        cells = decode_batch(np.frombuffer(code[3:], dtype=np.uint8).reshape(1, -1), m * n)[0]
+        board = cells.reshape(m, n)
+    else:
+        game = TicTacToe()
+        board = decode_batch(np.array([code], dtype=np.int64))[0].reshape(3, 3)
+    game.curr_player = 'X' if np.count_nonzero(board == STONES['X']) == np.count_nonzero(board == STONES['O']) else 'O'
+    game.board_state = [[(None, 'X', 'O')[v] for v in row] for row in board.tolist()]
+    return game
+
+def encode_batch(boards: np.ndarray, packed: Optional[bool] = None) -> np.ndarray:
+    """
+    Encode many boards at once.
+    :param boards: (N, num_cells) array of cell values, e.g. BatchTicTacToe.boards
+    :param packed: True for packed rows, False for base-3 codes (Tic Tac Toe only). By default boards of 9 cells are taken
+        for Tic Tac Toe; pass True for other games with 9 cells, such as a 3,3,3-game or a 1,9,3-game.
+    :return: (N,) int64 base-3 codes, or (N, ceil(num_cells / 4)) uint8 packed rows
+    """
+    boards = np.asarray(boards)
+    if packed is None:
+        packed = boards.shape[1] != 9
+    if not packed:
+        return boards.astype(np.int64) @ POWERS_OF_3
+    num_cells = boards.shape[1]
+    padded = np.zeros((boards.shape[0], -(-num_cells // 4) * 4), dtype=np.uint8)
+    padded[:, :num_cells] = boards
+    quads = padded.reshape(boards.shape[0], -1, 4)
+    return (quads[:, :, 0] | quads[:, :, 1] << 2 | quads[:, :, 2] << 4 | quads[:, :, 3] << 6).astype(np.uint8)
+
+def decode_batch(codes: np.ndarray, num_cells: int = 9) -> np.ndarray:
+    """
+    Decode many boards at once; the inverse of encode_batch().
+    :param codes: (N,) base-3 codes or (N, num_bytes) packed rows
+    :param num_cells: number of cells per board
+    :return: (N, num_cells) int8 array of cell values
+    """
+    codes = np.asarray(codes)
+    if num_cells == 9 and codes.ndim == 1:
+        return (codes[:, None] // POWERS_OF_3 % 3).astype(np.int8)
+    shifts = np.array([0, 2, 4, 6], dtype=np.uint8)
+    cells = (codes[:, :, None] >> shifts) & 0b11
+    return cells.reshape(codes.shape[0], -1)[:, :num_cells].astype(np.int8)
@@ -0,0 +1,135 @@
+"""
+This module contains the incremental pattern evaluation used by depth-limited search on m,n,k boards such as Gomoku.
+* Every k-in-a-row window of the board is a pattern. A window holding stones of only one player is an open
+  two, three, four, ... for that player and scores pattern_weights(k)[count]. Windows holding stones of both players are dead.
+* The score is kept up to date on every move and undo, so evaluating a leaf is a single division instead of a board scan.
+* The evaluator also keeps the empty cells near the stones, which are the only moves worth searching on a large board.
+"""
+from typing import List, Optional
+from .game import MNKGame, DIRECTIONS, EMPTY, STONES
+
+def pattern_weights(k: int) -> List[int]:
+    """
+    Weight of a window with 0, 1, ..., k stones of one player: every extra stone is worth ten times more.
+    """
+    return [0] + [10 ** (count - 1) for count in range(1, k + 1)]
+
+SCORE_SCALE = 1000 # Score at which the squashed evaluation reaches 0.5, about one open four on a Gomoku board
+NEIGHBOUR_RADIUS = 2 # Search only empty cells within this many rows/columns of a stone
+NEIGHBOURHOOD_MIN_CELLS = 64 # Smaller boards search every empty cell, so their full-depth search stays exact
+
+class PatternEvaluator():
+    def __init__(self, game: MNKGame, radius: Optional[int] = NEIGHBOUR_RADIUS):
+        """
+        Build the windows of the board and score the current position.
+        Attach the evaluator with game.evaluator = PatternEvaluator(game); the game then calls place() and remove() on every move.
+        :param game: m,n,k game to evaluate
+        :param radius: distance from the stones of the candidate moves. None, or a board under NEIGHBOURHOOD_MIN_CELLS cells,
+            makes every empty cell a candidate.
+        """
+        m, n, k = game.m, game.n, game.k
+        self.n = n
+        if m * n < NEIGHBOURHOOD_MIN_CELLS:
+            radius = None
+        self.radius = radius
+        self.windows_through: List[List[int]] = [[] for _ in range(m * n)]
+        num_windows = 0
+        for dx, dy in DIRECTIONS:
+            for x in range(m):
+                for y in range(n):
+                    end_x, end_y = x + (k - 1) * dx, y + (k - 1) * dy
+                    if 0 <= end_x < m and 0 <= end_y < n:
+                        for i in range(k):
+                            self.windows_through[(x + i * dx) * n + y + i * dy].append(num_windows)
+                        num_windows += 1
+        #* value[x_count][o_count] of a window, from the perspective of 'X'
+        weights = pattern_weights(k)
+        self.value = [[weights[x] if not o else -weights[o] if not x else 0 for o in range(k + 1)] for x in range(k + 1)]
+        reach = radius or 0
+        self.neighbours = [[i * n + j for i in range(max(0, x - reach), min(m, x + reach + 1))
+                                      for j in range(max(0, y - reach), min(n, y + reach + 1)) if (i, j) != (x, y)]
+                           for x in range(m) for y in range(n)]
+        self.num_windows = num_windows
+        self.reset(game)
+
+    def reset(self, game: MNKGame):
+        """
+        Recompute the score and candidate moves from scratch after the board was changed directly.
+        """
+        self.x_counts = [0] * self.num_windows
+        self.o_counts = [0] * self.num_windows
+        self.occupied = [False] * len(self.windows_through)
+        self.near = [0] * len(self.windows_through) # Number of stones within the radius of each cell
+        self.candidates = set()
+        self.score = 0
+        for cell, stone in enumerate(game.board.ravel().tolist()):
+            if stone != EMPTY:
+                self.place(cell // self.n, cell % self.n, stone)
+
+    def place(self, x: int, y: int, stone: int):
+        """
+        Update the score and candidate moves for a stone put on (x, y).
+        """
+        cell = x * self.n + y
+        value = self.value
+        counts = self.x_counts if stone == STONES['X'] else self.o_counts
+        other = self.o_counts if stone == STONES['X'] else self.x_counts
+        score = self.score
+        for w in self.windows_through[cell]:
+            count = counts[w]
+            if stone == STONES['X']:
+                score += value[count + 1][other[w]] - value[count][other[w]]
+            else:
+                score += value[other[w]][count + 1] - value[other[w]][count]
+            counts[w] = count + 1
+        self.score = score
+        self.occupied[cell] = True
+        self.candidates.discard(cell)
+        near, occupied, candidates = self.near, self.occupied, self.candidates
+        for neighbour in self.neighbours[cell]:
+            near[neighbour] += 1
+            if not occupied[neighbour]:
+                candidates.add(neighbour)
+
+    def remove(self, x: int, y: int, stone: int):
+        """
+        Undo place() for the stone on (x, y).
+        """
+        cell = x * self.n + y
+        value = self.value
+        counts = self.x_counts if stone == STONES['X'] else self.o_counts
+        other = self.o_counts if stone == STONES['X'] else self.x_counts
+        score = self.score
+        for w in self.windows_through[cell]:
+            count = counts[w]
+            if stone == STONES['X']:
+                score += value[count - 1][other[w]] - value[count][other[w]]
+            else:
+                score += value[other[w]][count - 1] - value[other[w]][count]
+            counts[w] = count - 1
+        self.score = score
+        self.occupied[cell] = False
+        near, candidates = self.near, self.candidates
+        for neighbour in self.neighbours[cell]:
+            near[neighbour] -= 1
+            if not near[neighbour]:
+                candidates.discard(neighbour)
+        if near[cell]:
+            candidates.add(cell)
+
+    def evaluate(self, player_letter: str) -> float:
+        """
+        Heuristic value of the position, squashed into (-1, 1) so that it stays below a proven win or loss.
+        :param player_letter: the player whose perspective to take
+        :return: the value of the position for player_letter
+        """
+        score = self.score if player_letter == 'X' else -self.score
+        return score / (abs(score) + SCORE_SCALE)
+
+    def candidate_moves(self, game: MNKGame) -> List[List[int]]:
+        """
+        Empty cells within the radius of a stone, in row-major order, or all empty cells on an empty or small board.
+        """
+        if self.radius is None or not self.candidates:
+            return game.empty_cells()
+        return [[cell // self.n, cell % self.n] for cell in sorted(self.candidates)]
@@ -1,195 +1,599 @@
-"""
-This module contains the game logic for Tic Tac Toe and Gomoku. 
-* You may need to understand the code to implement your own players. 
-! The code should not be modified.
-"""
-from typing import List, Optional
-from abc import ABC, abstractmethod
-
-class Game(ABC):
-    
-    @abstractmethod
-    def empty_cells(self, state: Optional[List[List[int]]]) -> List[List[int]]:
-        """
-        Get a list of empty cells for the GIVEN state. If state is None, return the list of empty cells for the CURRENT state.
-        :param state: the state of the current board
-        :return: a list of empty cells
-        """
-        pass
-    
-    @abstractmethod
-    def print_board(self):
-        """
-        Visualization of current board state.
-        """
-        pass
-    
-    @abstractmethod
-    def init_board(self):
-        """
-        Draw the initial board and show the game info.
-        """
-        pass
-    
-    @abstractmethod
-    def valid_move(self, x: int, y: int) -> bool:
-        """
-        Check if the cell (x,y) is a valid move.
-        :param x: X coordinate
-        :param y: Y coordinate
-        :return: True if the move is valid
-        """
-        pass
-    
-    @abstractmethod
-    def set_move(self, x: int, y: int, player_letter: str) -> bool:
-        """
-        Set the move on board, if the coordinates are valid.
-        :param x: X coordinate
-        :param y: Y coordinate
-        :param player_letter: 'X' or 'O
-        :return: True if the move is set successfully
-        """
-        pass
-
-    @abstractmethod
-    def wins(self, player_letter: str, state: Optional[List[List[int]]]) -> bool:
-        """
-        This function tests if a specific player wins in a GIVEN or CURRENT state (if state is None).
-        :param state: the state of the current board
-        :param player_letter: 'X' or 'O
-        :return: True if the player wins
-        """
-        pass
-        
-    @abstractmethod
-    def game_over(self) -> bool:
-        """
-        This function test if the game is over for the current state
-        :return: True if the game is over (either a player wins or the game is draw)
-        """
-        pass
-    
-    @abstractmethod
-    def restart(self) -> None:
-        """
-        This function restarts the game
-        """
-        pass
-    
-    @abstractmethod
-    def copy(self) -> 'Game':
-        """
-        This function returns a copy of the current game
-        """
-        pass
-    
-    @abstractmethod
-    def __str__(self) -> str:
-        return "Game"
-    
-class TicTacToe(Game):
-    def __init__(self):
-        #* Initialize board, available moves, last move, and win_combo
-        self.board_state = [[None, None, None], [None, None, None], [None, None, None]]
-        self.win_combo = []
-        self.curr_player = 'X'
-    
-    def print_board(self):
-        height = len(self.board_state)
-        width = len(self.board_state[0])
-        
-        for i in range(height):
-            print('-------------')
-            for j in range(width):
-                if self.board_state[i][j] == None:
-                    print('|   ', end='')
-                elif self.board_state[i][j] == 'X':
-                    print('| X ', end='')
-                elif self.board_state[i][j] == 'O':
-                    print('| O ', end='')
-                else:
-                    raise ValueError(f"Invalid value {self.board_state[i][j]} in the board")
-            print("|")
-        print('-------------')
-
-    def init_board(self):
-        number_board = [[str(i+1) for i in range(j*3, (j+1)*3)] for j in range(3)]
-        print("\nGame board:")
-        for row in number_board:
-            print('-------------')
-            print('| ' + ' | '.join(row) + ' |')
-        print('-------------\n')
-
-    def empty_cells(self, state = None):
-        cells = []
-        if state == None:
-            state = self.board_state
-            
-        for x in range(3):
-            for y in range(3):
-                if state[x][y] == None:
-                    cells.append([x, y])
-        return cells
-    
-    def valid_move(self, x, y):
-        if self.board_state[x][y] == None:
-            return True
-        else:
-            return False
-    
-    def set_move(self, x, y, player_letter):
-        assert self.curr_player == player_letter, f"Invalid player {player_letter}. Current player is {self.curr_player}"
-        if self.valid_move(x, y):
-            self.board_state[x][y] = player_letter
-            self.curr_player = 'X' if self.curr_player == 'O' else 'O'
-            return True
-        else:
-            return False
-    
-    def reset_move(self, x, y):
-        self.curr_player = self.board_state[x][y]
-        self.board_state[x][y] = None
-
-    def wins(self, player_letter, state=None):
-        if state == None:
-            state = self.board_state # current state
-        
-        # All possible winning states
-        win_states = [
-            [(0, 0), (0, 1), (0, 2)],
-            [(1, 0), (1, 1), (1, 2)],
-            [(2, 0), (2, 1), (2, 2)],
-            [(0, 0), (1, 0), (2, 0)],
-            [(0, 1), (1, 1), (2, 1)],
-            [(0, 2), (1, 2), (2, 2)],
-            [(0, 0), (1, 1), (2, 2)],
-            [(2, 0), (1, 1), (0, 2)],
-        ]
-        
-        for win_state in win_states:
-            moves = set([state[x][y] for x, y in win_state])
-            if len(moves) == 1 and player_letter in moves:
-                self.win_combo = win_state
-                return True
-        return False
-
-    def game_over(self):
-        return self.wins('X') or self.wins('O') or len(self.empty_cells()) == 0
-    
-    def restart(self):
-        self.board_state = [[None, None, None], [None, None, None], [None, None, None]]
-        self.last_move = (-1, -1)
-        self.win_combo = []
-        self.curr_player = 'X'
-        
-    def copy(self):
-        new_game = TicTacToe()
-        new_game.board_state = [row[:] for row in self.board_state]
-        new_game.win_combo = self.win_combo.copy()
-        new_game.curr_player = self.curr_player
-        return new_game
-    
-    def __str__(self) -> str:
-        return "Tic Tac Toe"
-        
\ No newline at end of file
+"""
+This module contains the game logic for Tic Tac Toe and Gomoku. 
+* You may need to understand the code to implement your own players. 
+! The code should not be modified.
+"""
+from typing import List, Optional, Tuple, Union
+from abc import ABC, abstractmethod
+import numpy as np
+import random
+
+class Game(ABC):
+    # Subclasses list their attributes in __slots__: search players create and copy many game objects
+    __slots__ = ()
+    evaluator = None # Incremental evaluation kept up to date by every move, see project/evaluation.py (MNKGame only)
+    
+    @abstractmethod
+    def empty_cells(self, state: Optional[List[List[int]]]) -> List[List[int]]:
+        """
+        Get a list of empty cells for the GIVEN state. If state is None, return the list of empty cells for the CURRENT state.
+        :param state: the state of the current board
+        :return: a list of empty cells
+        """
+        pass
+    
+    @abstractmethod
+    def print_board(self):
+        """
+        Visualization of current board state.
+        """
+        pass
+    
+    @abstractmethod
+    def init_board(self):
+        """
+        Draw the initial board and show the game info.
+        """
+        pass
+    
+    @abstractmethod
+    def valid_move(self, x: int, y: int) -> bool:
+        """
+        Check if the cell (x,y) is a valid move.
+        :param x: X coordinate
+        :param y: Y coordinate
+        :return: True if the move is valid
+        """
+        pass
+    
+    @abstractmethod
+    def set_move(self, x: int, y: int, player_letter: str) -> bool:
+        """
+        Set the move on board, if the coordinates are valid.
+        :param x: X coordinate
+        :param y: Y coordinate
+        :param player_letter: 'X' or 'O
+        :return: True if the move is set successfully
+        """
+        pass
+
+    @abstractmethod
+    def push(self, move: Union[List[int], Tuple[int, int]]) -> None:
+        """
+        Play a move for the current player in place and remember it on the move stack, so it can be undone with pop().
+        :param move: (x, y) coordinates of the move
+        """
+        pass
+
+    @abstractmethod
+    def pop(self) -> Tuple[int, int]:
+        """
+        Undo the last move played with push(), restoring the current player and win_combo.
+        :return: (x, y) coordinates of the undone move
+        """
+        pass
+
+    @abstractmethod
+    def wins(self, player_letter: str, state: Optional[List[List[int]]]) -> bool:
+        """
+        This function tests if a specific player wins in a GIVEN or CURRENT state (if state is None).
+        :param state: the state of the current board
+        :param player_letter: 'X' or 'O
+        :return: True if the player wins
+        """
+        pass
+        
+    @abstractmethod
+    def game_over(self) -> bool:
+        """
+        This function test if the game is over for the current state
+        :return: True if the game is over (either a player wins or the game is draw)
+        """
+        pass
+    
+    @abstractmethod
+    def restart(self) -> None:
+        """
+        This function restarts the game
+        """
+        pass
+    
+    @abstractmethod
+    def copy(self) -> 'Game':
+        """
+        This function returns a copy of the current game
+        """
+        pass
+    
+    @abstractmethod
+    def __str__(self) -> str:
+        return "Game"
+    
+#* Zobrist hashing: every (cell, stone) pair and the side to move get a fixed random 64-bit key.
+#* The seed is fixed so that keys agree between runs and processes.
+ZOBRIST_SEED = 20240601
+ZOBRIST_SIDE = random.Random(ZOBRIST_SEED).getrandbits(64) # XOR-ed in when 'O' is to move
+_zobrist_tables = {}
+
+def zobrist_table(num_cells: int) -> List[Tuple[int, int, int]]:
+    """
+    Get the Zobrist keys for a board with the given number of cells.
+    :param num_cells: number of cells on the board
+    :return: per cell, the keys for (empty, 'X', 'O'); the empty key is always 0
+    """
+    if num_cells not in _zobrist_tables:
+        rng = random.Random(ZOBRIST_SEED + num_cells)
+        _zobrist_tables[num_cells] = [(0, rng.getrandbits(64), rng.getrandbits(64)) for _ in range(num_cells)]
+    return _zobrist_tables[num_cells]
+
+#* Bitboard layout: cell (x, y) is stored in bit 3*x + y of a 9-bit integer
+FULL_MASK = 0b111111111
+
+WIN_COMBOS = [
+    [(0, 0), (0, 1), (0, 2)],
+    [(1, 0), (1, 1), (1, 2)],
+    [(2, 0), (2, 1), (2, 2)],
+    [(0, 0), (1, 0), (2, 0)],
+    [(0, 1), (1, 1), (2, 1)],
+    [(0, 2), (1, 2), (2, 2)],
+    [(0, 0), (1, 1), (2, 2)],
+    [(2, 0), (1, 1), (0, 2)],
+]
+WIN_MASKS = [sum(1 << (3*x + y) for x, y in combo) for combo in WIN_COMBOS]
+
+# (mask, combo) of the lines passing through each cell, so a move only checks its own lines
+LINES_THROUGH = [[(mask, combo) for mask, combo in zip(WIN_MASKS, WIN_COMBOS) if mask >> i & 1] for i in range(9)]
+
+# Empty cells for every possible mask of free squares, in row-major order
+FREE_CELLS = [tuple((i // 3, i % 3) for i in range(9) if mask >> i & 1) for mask in range(FULL_MASK + 1)]
+
+ZOBRIST_TTT = zobrist_table(9)
+
+def state_to_bits(state: List[List[Optional[str]]]):
+    """
+    Convert a list-of-lists board into a pair of bitboards.
+    :param state: 3x3 board of None/'X'/'O'
+    :return: (x_bits, o_bits)
+    """
+    x_bits, o_bits = 0, 0
+    for x in range(3):
+        for y in range(3):
+            if state[x][y] == 'X':
+                x_bits |= 1 << (3*x + y)
+            elif state[x][y] == 'O':
+                o_bits |= 1 << (3*x + y)
+    return x_bits, o_bits
+
+class TicTacToe(Game):
+    __slots__ = ('x_bits', 'o_bits', 'win_combo', 'curr_player', 'move_stack', 'winner', 'num_moves', '_hash_key')
+    m = n = k = 3 # Board shape as an m,n,k game, shared with MNKGame
+    
+    def __init__(self):
+        #* Initialize bitboards for both players, win_combo and current player
+        self.x_bits = 0
+        self.o_bits = 0
+        self.win_combo = []
+        self.curr_player = 'X'
+        self.move_stack = []
+        #* Running game status, updated by every move
+        self.winner = None
+        self.num_moves = 0
+        self._hash_key = 0
+    
+    @property
+    def hash_key(self) -> int:
+        """
+        64-bit Zobrist key of the position (stones and side to move), maintained incrementally by every move.
+        """
+        return self._hash_key
+    
+    @property
+    def board_state(self) -> List[List[Optional[str]]]:
+        """
+        Read-only list-of-lists view of the bitboards (None/'X'/'O' per cell).
+        Modifying the returned lists does not change the game.
+        """
+        x_bits, o_bits = self.x_bits, self.o_bits
+        return [['X' if x_bits >> i & 1 else 'O' if o_bits >> i & 1 else None for i in range(r, r + 3)] for r in (0, 3, 6)]
+    
+    @board_state.setter
+    def board_state(self, state: List[List[Optional[str]]]):
+        self.x_bits, self.o_bits = state_to_bits(state)
+        self._refresh_status()
+    
+    def _refresh_status(self):
+        """
+        Recompute winner, win_combo, move count and hash key from scratch after the bitboards were changed directly.
+        """
+        self.num_moves = bin(self.x_bits | self.o_bits).count('1')
+        self._hash_key = ZOBRIST_SIDE if self.curr_player == 'O' else 0
+        for i in range(9):
+            if self.x_bits >> i & 1:
+                self._hash_key ^= ZOBRIST_TTT[i][1]
+            elif self.o_bits >> i & 1:
+                self._hash_key ^= ZOBRIST_TTT[i][2]
+        self.winner = None
+        self.win_combo = []
+        for letter, bits in (('X', self.x_bits), ('O', self.o_bits)):
+            for mask, combo in zip(WIN_MASKS, WIN_COMBOS):
+                if bits & mask == mask:
+                    self.winner = letter
+                    self.win_combo = combo
+                    return
+    
+    def _place(self, x, y):
+        """
+        Put a stone of the current player on (x, y), checking only the lines through that cell for a win.
+        """
+        cell = 3*x + y
+        if self.curr_player == 'X':
+            self.x_bits |= 1 << cell
+            bits = self.x_bits
+            self._hash_key ^= ZOBRIST_TTT[cell][1] ^ ZOBRIST_SIDE
+        else:
+            self.o_bits |= 1 << cell
+            bits = self.o_bits
+            self._hash_key ^= ZOBRIST_TTT[cell][2] ^ ZOBRIST_SIDE
+        self.num_moves += 1
+        for mask, combo in LINES_THROUGH[cell]:
+            if bits & mask == mask:
+                self.winner = self.curr_player
+                self.win_combo = combo
+                break
+        self.curr_player = 'X' if self.curr_player == 'O' else 'O'
+    
+    def print_board(self):
+        board = self.board_state
+        height = len(board)
+        width = len(board[0])
+        
+        for i in range(height):
+            print('-------------')
+            for j in range(width):
+                if board[i][j] == None:
+                    print('|   ', end='')
+                elif board[i][j] == 'X':
+                    print('| X ', end='')
+                elif board[i][j] == 'O':
+                    print('| O ', end='')
+                else:
+                    raise ValueError(f"Invalid value {board[i][j]} in the board")
+            print("|")
+        print('-------------')
+
+    def init_board(self):
+        number_board = [[str(i+1) for i in range(j*3, (j+1)*3)] for j in range(3)]
+        print("\nGame board:")
+        for row in number_board:
+            print('-------------')
+            print('| ' + ' | '.join(row) + ' |')
+        print('-------------\n')
+
+    def empty_cells(self, state = None):
+        if state == None:
+            occupied = self.x_bits | self.o_bits
+        else:
+            x_bits, o_bits = state_to_bits(state)
+            occupied = x_bits | o_bits
+        return [[x, y] for x, y in FREE_CELLS[FULL_MASK & ~occupied]]
+    
+    def valid_move(self, x, y):
+        return not (self.x_bits | self.o_bits) >> (3*x + y) & 1
+    
+    def set_move(self, x, y, player_letter):
+        assert self.curr_player == player_letter, f"Invalid player {player_letter}. Current player is {self.curr_player}"
+        if self.valid_move(x, y):
+            self._place(x, y)
+            return True
+        else:
+            return False
+    
+    def reset_move(self, x, y):
+        bit = 1 << (3*x + y)
+        if self.x_bits & bit:
+            letter, stone = 'X', 1
+        elif self.o_bits & bit:
+            letter, stone = 'O', 2
+        else:
+            return
+        self._hash_key ^= ZOBRIST_TTT[3*x + y][stone]
+        if self.curr_player != letter:
+            self._hash_key ^= ZOBRIST_SIDE
+            self.curr_player = letter
+        self.x_bits &= ~bit
+        self.o_bits &= ~bit
+        self.num_moves -= 1
+        if self.winner is not None:
+            self._refresh_status()
+
+    def push(self, move):
+        x, y = move
+        if (self.x_bits | self.o_bits) >> (3*x + y) & 1:
+            raise ValueError(f"Invalid move {(x, y)}. The cell is not empty")
+        self.move_stack.append((x, y, self.win_combo, self.winner))
+        self._place(x, y)
+
+    def pop(self):
+        x, y, self.win_combo, self.winner = self.move_stack.pop()
+        bit = 1 << (3*x + y)
+        if self.x_bits & bit:
+            self.x_bits ^= bit
+            self.curr_player = 'X'
+            self._hash_key ^= ZOBRIST_TTT[3*x + y][1] ^ ZOBRIST_SIDE
+        else:
+            self.o_bits ^= bit
+            self.curr_player = 'O'
+            self._hash_key ^= ZOBRIST_TTT[3*x + y][2] ^ ZOBRIST_SIDE
+        self.num_moves -= 1
+        return x, y
+
+    def wins(self, player_letter, state=None):
+        if state == None:
+            return self.winner == player_letter # current state is tracked move by move
+        
+        bits = state_to_bits(state)[0 if player_letter == 'X' else 1]
+        for mask, win_state in zip(WIN_MASKS, WIN_COMBOS):
+            if bits & mask == mask:
+                self.win_combo = win_state
+                return True
+        return False
+
+    def game_over(self):
+        return self.winner is not None or self.num_moves == 9
+    
+    def restart(self):
+        self.x_bits = 0
+        self.o_bits = 0
+        self.win_combo = []
+        self.curr_player = 'X'
+        self.move_stack = []
+        self.winner = None
+        self.num_moves = 0
+        self._hash_key = 0
+        
+    def copy(self):
+        new_game = TicTacToe()
+        new_game.x_bits = self.x_bits
+        new_game.o_bits = self.o_bits
+        new_game.win_combo = self.win_combo # never mutated in place, only rebound
+        new_game.curr_player = self.curr_player
+        new_game.move_stack = self.move_stack.copy()
+        new_game.winner = self.winner
+        new_game.num_moves = self.num_moves
+        new_game._hash_key = self._hash_key
+        return new_game
+    
+    def __str__(self) -> str:
+        return "Tic Tac Toe"
+
+#* Cell values of the NumPy board used by MNKGame
+EMPTY = 0
+STONES = {'X': 1, 'O': 2}
+LETTERS = (None, 'X', 'O')
+
+# Row, column, diagonal and anti-diagonal steps for counting runs through a cell
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+class MNKGame(Game):
+    __slots__ = ('m', 'n', 'k', 'board', 'empty', 'win_combo', 'curr_player', 'move_stack', 'winner', 'num_moves', 'zobrist', '_hash_key', 'evaluator')
+    
+    def __init__(self, m: int, n: int, k: int):
+        """
+        Generalised m,n,k game: players alternate on an m x n board and the first to get k in a row wins.
+        :param m: number of rows
+        :param n: number of columns
+        :param k: length of the row needed to win
+        """
+        self.m, self.n, self.k = m, n, k
+        #* Initialize board, empty cells, win_combo and current player
+        self.board = np.zeros((m, n), dtype=np.int8)
+        self.empty = set((x, y) for x in range(m) for y in range(n))
+        self.win_combo = []
+        self.curr_player = 'X'
+        self.move_stack = []
+        #* Running game status, updated by every move
+        self.winner = None
+        self.num_moves = 0
+        self.zobrist = zobrist_table(m * n)
+        self._hash_key = 0
+        self.evaluator = None
+    
+    @property
+    def hash_key(self) -> int:
+        """
+        64-bit Zobrist key of the position (stones and side to move), maintained incrementally by every move.
+        """
+        return self._hash_key
+    
+    @property
+    def board_state(self) -> List[List[Optional[str]]]:
+        """
+        Read-only list-of-lists view of the NumPy board (None/'X'/'O' per cell).
+        Modifying the returned lists does not change the game.
+        """
+        return [[LETTERS[v] for v in row] for row in self.board.tolist()]
+    
+    @board_state.setter
+    def board_state(self, state: List[List[Optional[str]]]):
+        self.board = np.array([[STONES.get(v, EMPTY) for v in row] for row in state], dtype=np.int8)
+        self._refresh_status()
+    
+    def _refresh_status(self):
+        """
+        Recompute empty cells, winner, win_combo, move count and hash key from scratch after the board was changed directly.
+        """
+        self.empty = set((int(x), int(y)) for x, y in zip(*np.nonzero(self.board == EMPTY)))
+        self.num_moves = self.m * self.n - len(self.empty)
+        self.zobrist = zobrist_table(self.m * self.n)
+        self._hash_key = ZOBRIST_SIDE if self.curr_player == 'O' else 0
+        for cell, stone in enumerate(self.board.ravel().tolist()):
+            self._hash_key ^= self.zobrist[cell][stone]
+        if self.evaluator is not None:
+            self.evaluator.reset(self)
+        self.winner = None
+        self.win_combo = []
+        for x, y in zip(*np.nonzero(self.board)):
+            line = self._run_through(int(x), int(y))
+            if line:
+                self.winner = LETTERS[self.board[x, y]]
+                self.win_combo = line
+                return
+    
+    def _run_through(self, x, y):
+        """
+        Find a run of at least k equal stones through (x, y) by walking the four directions from the cell.
+        :return: the cells of the run, or an empty list if there is none
+        """
+        board, m, n = self.board, self.m, self.n
+        stone = board[x, y]
+        for dx, dy in DIRECTIONS:
+            line = [(x, y)]
+            for sign in (1, -1):
+                i, j = x + sign*dx, y + sign*dy
+                while 0 <= i < m and 0 <= j < n and board[i, j] == stone:
+                    line.append((i, j))
+                    i, j = i + sign*dx, j + sign*dy
+            if len(line) >= self.k:
+                return sorted(line)
+        return []
+    
+    def _place(self, x, y):
+        """
+        Put a stone of the current player on (x, y), counting only the runs through that cell for a win.
+        """
+        stone = STONES[self.curr_player]
+        self.board[x, y] = stone
+        self.empty.discard((x, y))
+        self.num_moves += 1
+        self._hash_key ^= self.zobrist[x*self.n + y][stone] ^ ZOBRIST_SIDE
+        if self.evaluator is not None:
+            self.evaluator.place(x, y, stone)
+        line = self._run_through(x, y)
+        if line:
+            self.winner = self.curr_player
+            self.win_combo = line
+        self.curr_player = 'X' if self.curr_player == 'O' else 'O'
+    
+    def print_board(self):
+        print('   ' + ' '.join(f'{j:>2}' for j in range(self.n)))
+        for i, row in enumerate(self.board_state):
+            print(f'{i:>2} ' + ' '.join(f'{v or ".":>2}' for v in row))
+
+    def init_board(self):
+        print(f"\n{self}: {self.m}x{self.n} board, get {self.k} in a row to win.")
+        print("Moves are given as (row, column), counting from 0.\n")
+
+    def empty_cells(self, state = None):
+        if state == None:
+            # Row-major order, as TicTacToe.empty_cells(), so ties between moves break the same way on every board
+            return np.argwhere(self.board == EMPTY).tolist()
+        return [[x, y] for x, row in enumerate(state) for y, v in enumerate(row) if v == None]
+    
+    def valid_move(self, x, y):
+        return 0 <= x < self.m and 0 <= y < self.n and self.board[x, y] == EMPTY
+    
+    def set_move(self, x, y, player_letter):
+        assert self.curr_player == player_letter, f"Invalid player {player_letter}. Current player is {self.curr_player}"
+        if self.valid_move(x, y):
+            self._place(x, y)
+            return True
+        else:
+            return False
+    
+    def reset_move(self, x, y):
+        stone = self.board[x, y]
+        if stone == EMPTY:
+            return
+        self._hash_key ^= self.zobrist[x*self.n + y][stone]
+        if self.curr_player != LETTERS[stone]:
+            self._hash_key ^= ZOBRIST_SIDE
+            self.curr_player = LETTERS[stone]
+        self.board[x, y] = EMPTY
+        self.empty.add((x, y))
+        self.num_moves -= 1
+        if self.evaluator is not None:
+            self.evaluator.remove(x, y, stone)
+        if self.winner is not None:
+            self._refresh_status()
+
+    def push(self, move):
+        x, y = move
+        if not self.valid_move(x, y):
+            raise ValueError(f"Invalid move {(x, y)}. The cell is not empty")
+        self.move_stack.append((x, y, self.win_combo, self.winner))
+        self._place(x, y)
+
+    def pop(self):
+        x, y, self.win_combo, self.winner = self.move_stack.pop()
+        stone = self.board[x, y]
+        self.curr_player = LETTERS[stone]
+        self._hash_key ^= self.zobrist[x*self.n + y][stone] ^ ZOBRIST_SIDE
+        self.board[x, y] = EMPTY
+        self.empty.add((x, y))
+        self.num_moves -= 1
+        if self.evaluator is not None:
+            self.evaluator.remove(x, y, stone)
+        return x, y
+
+    def wins(self, player_letter, state=None):
+        if state == None:
+            return self.winner == player_letter # current state is tracked move by move
+        
+        game = self.__class__.__new__(self.__class__)
+        game.m, game.n, game.k = self.m, self.n, self.k
+        game.curr_player = self.curr_player
+        game.evaluator = None
+        game.board_state = state
+        if game.winner == player_letter:
+            self.win_combo = game.win_combo
+            return True
+        return False
+
+    def game_over(self):
+        return self.winner is not None or self.num_moves == self.m * self.n
+    
+    def restart(self):
+        self.board = np.zeros((self.m, self.n), dtype=np.int8)
+        self.empty = set((x, y) for x in range(self.m) for y in range(self.n))
+        self.win_combo = []
+        self.curr_player = 'X'
+        self.move_stack = []
+        self.winner = None
+        self.num_moves = 0
+        self._hash_key = 0
+        if self.evaluator is not None:
+            self.evaluator.reset(self)
+        
+    def copy(self):
+        new_game = self.__class__.__new__(self.__class__)
+        new_game.m, new_game.n, new_game.k = self.m, self.n, self.k
+        new_game.zobrist = self.zobrist
+        new_game.board = self.board.copy()
+        new_game.empty = self.empty.copy()
+        new_game.win_combo = self.win_combo # never mutated in place, only rebound
+        new_game.curr_player = self.curr_player
+        new_game.move_stack = self.move_stack.copy()
+        new_game.winner = self.winner
+        new_game.num_moves = self.num_moves
+        new_game._hash_key = self._hash_key
+        new_game.evaluator = None # An evaluator follows one game; attach a new one to the copy if needed
+        return new_game
+    
+    def __str__(self) -> str:
+        return f"{self.m},{self.n},{self.k}-Game"
+
+class Gomoku(MNKGame):
+    __slots__ = ()
+    
+    def __init__(self, size: int = 15, k: int = 5):
+        """
+        Gomoku (free-style): k in a row on a square board of the given size.
+        """
+        super().__init__(size, size, k)
+    
+    @property
+    def size(self) -> int:
+        return self.m
+    
+    def __str__(self) -> str:
+        return "Gomoku"
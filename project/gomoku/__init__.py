@@ -0,0 +1,4 @@
+"""
+This module contains the Player classes for Gomoku game.
+"""
+from .human import GMK_HumanPlayer
\ No newline at end of file
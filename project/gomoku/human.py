@@ -0,0 +1,24 @@
+# This file contains the Human Player class for the Gomoku game
+from ..player import Player
+from ..game import Gomoku
+
+class GMK_HumanPlayer(Player):
+    def __init__(self, letter):
+        super().__init__(letter)
+    
+    def get_move(self, game: Gomoku):
+        # Get input move from human as "row col"
+        while True:
+            try:
+                x, y = map(int, input(f"Human move [{self.letter}] (row col): ").split())
+                if game.valid_move(x, y):
+                    return (x, y)
+                print('Bad move')
+            except (EOFError, KeyboardInterrupt):
+                print('Bye')
+                exit()
+            except ValueError:
+                print('Bad choice')
+    
+    def __str__(self) -> str:
+        return "Human Player"
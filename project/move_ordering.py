@@ -0,0 +1,97 @@
+"""
+This module contains the move ordering heuristics for alpha-beta search. Searching good moves first makes cutoffs happen earlier.
+* 'tt': the best move stored in the transposition table for the position.
+* 'killer': moves that caused a cutoff at the same ply in a sibling position.
+* 'history': moves that caused cutoffs anywhere, weighted by depth**2.
+* 'static': cells that lie on more winning windows (the centre, then corners on a 3x3 board).
+Moves are ranked by the TT move, then killers, then the static prior, then the history score.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from .game import Game, DIRECTIONS
+
+HEURISTICS = ('tt', 'killer', 'history', 'static')
+NUM_KILLERS = 2
+
+_priors = {}
+
+def static_priors(m: int, n: int, k: int) -> List[List[int]]:
+    """
+    Number of k-in-a-row windows through every cell of an m x n board.
+    On 3x3 this is 4 for the centre, 3 for corners and 2 for edges.
+    :return: m x n nested list of counts
+    """
+    if (m, n, k) not in _priors:
+        counts = np.zeros((m, n), dtype=np.int32)
+        for dx, dy in DIRECTIONS:
+            for x in range(m):
+                for y in range(n):
+                    end_x, end_y = x + (k - 1) * dx, y + (k - 1) * dy
+                    if 0 <= end_x < m and 0 <= end_y < n:
+                        for i in range(k):
+                            counts[x + i * dx, y + i * dy] += 1
+        _priors[(m, n, k)] = counts.tolist()
+    return _priors[(m, n, k)]
+
+class MoveOrdering():
+    def __init__(self, heuristics: Sequence[str] = HEURISTICS):
+        """
+        :param heuristics: the heuristics to use, a subset of HEURISTICS. With none, moves keep the order of empty_cells().
+        """
+        unknown = set(heuristics) - set(HEURISTICS)
+        if unknown:
+            raise ValueError(f"Unknown move ordering heuristics {sorted(unknown)}. Please choose from {HEURISTICS}")
+        self.use_tt = 'tt' in heuristics
+        self.use_killer = 'killer' in heuristics
+        self.use_history = 'history' in heuristics
+        self.use_static = 'static' in heuristics
+        self.killers: List[List[Tuple[int, int]]] = []
+        self.history: Dict[Tuple[int, int], int] = {}
+
+    def new_search(self):
+        """
+        Reset the killers, which are only meaningful within one search, and age the history table.
+        """
+        self.killers = []
+        self.history = {move: score // 2 for move, score in self.history.items() if score > 1}
+
+    def order(self, game: Game, moves: List[List[int]], ply: int, tt_move: Optional[Tuple[int, int]] = None) -> List[List[int]]:
+        """
+        Sort moves from the most to the least promising. Ties keep the order of empty_cells().
+        :param game: current game state
+        :param moves: legal moves
+        :param ply: distance from the root of the search
+        :param tt_move: best move from the transposition table, if any
+        :return: the sorted moves
+        """
+        killers = self.killers[ply] if self.use_killer and ply < len(self.killers) else ()
+        priors = static_priors(game.m, game.n, game.k) if self.use_static else None
+        tt_move = tt_move if self.use_tt else None
+
+        def key(move):
+            move = (move[0], move[1])
+            return (
+                move == tt_move,
+                move in killers,
+                priors[move[0]][move[1]] if priors is not None else 0,
+                self.history.get(move, 0) if self.use_history else 0,
+            )
+        return sorted(moves, key=key, reverse=True)
+
+    def cutoff(self, move: List[int], ply: int, depth: int):
+        """
+        Record a move that caused a beta cutoff.
+        :param move: the move
+        :param ply: distance from the root of the search
+        :param depth: remaining depth of the node where the cutoff happened
+        """
+        move = (move[0], move[1])
+        if self.use_killer:
+            while len(self.killers) <= ply:
+                self.killers.append([])
+            killers = self.killers[ply]
+            if move not in killers:
+                killers.insert(0, move)
+                del killers[NUM_KILLERS:]
+        if self.use_history:
+            self.history[move] = self.history.get(move, 0) + depth * depth
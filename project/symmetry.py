@@ -0,0 +1,90 @@
+"""
+This module contains the 8 symmetries (rotations and reflections) of the 3x3 Tic Tac Toe board.
+* Positions are mapped to a canonical form so players can store one entry per class of symmetric positions.
+* All tables are precomputed at import time, so every lookup is a list index.
+"""
+from typing import List, Tuple, Union
+from .game import TicTacToe, FULL_MASK
+
+def _transform_cell(x: int, y: int, rotations: int, mirror: bool) -> Tuple[int, int]:
+    """
+    Apply an optional left-right mirror followed by a number of clockwise quarter turns to a cell.
+    """
+    if mirror:
+        y = 2 - y
+    for _ in range(rotations):
+        x, y = y, 2 - x
+    return x, y
+
+# PERMUTATIONS[t][i] is the cell that cell i = 3*x + y is moved to by transform t (0 is the identity)
+PERMUTATIONS = [
+    [3*tx + ty for tx, ty in (_transform_cell(i // 3, i % 3, rotations, mirror) for i in range(9))]
+    for mirror in (False, True) for rotations in range(4)
+]
+
+# INVERSE[t] is the transform that undoes transform t
+INVERSE = [next(u for u in range(8) if all(PERMUTATIONS[u][PERMUTATIONS[t][i]] == i for i in range(9))) for t in range(8)]
+
+# MASK_TABLE[t][mask] is the 9-bit mask after applying transform t
+MASK_TABLE = [
+    [sum(1 << perm[i] for i in range(9) if mask >> i & 1) for mask in range(FULL_MASK + 1)]
+    for perm in PERMUTATIONS
+]
+
+def canonical_form(x_bits: int, o_bits: int) -> Tuple[int, int]:
+    """
+    Canonical form of a position given as bitboards.
+    :param x_bits: bitboard of 'X'
+    :param o_bits: bitboard of 'O'
+    :return: (key, transform) where key = x | o << 9 is the smallest over all symmetric positions and transform maps the position onto it
+    """
+    best_key, best_transform = x_bits | o_bits << 9, 0
+    for t in range(1, 8):
+        key = MASK_TABLE[t][x_bits] | MASK_TABLE[t][o_bits] << 9
+        if key < best_key:
+            best_key, best_transform = key, t
+    return best_key, best_transform
+
+def canonicalize(game: TicTacToe) -> Tuple[int, int]:
+    """
+    Canonical form of the current position of a game.
+    :param game: Tic Tac Toe game
+    :return: (key, transform), see canonical_form()
+    """
+    return canonical_form(game.x_bits, game.o_bits)
+
+def to_canonical(move: Union[List[int], Tuple[int, int]], transform: int) -> Tuple[int, int]:
+    """
+    Map a move from the game frame into the canonical frame.
+    :param move: (x, y) in the game frame
+    :param transform: transform returned by canonicalize()
+    :return: (x, y) in the canonical frame
+    """
+    cell = PERMUTATIONS[transform][3*move[0] + move[1]]
+    return cell // 3, cell % 3
+
+def from_canonical(move: Union[List[int], Tuple[int, int]], transform: int) -> Tuple[int, int]:
+    """
+    Map a move from the canonical frame back into the game frame.
+    :param move: (x, y) in the canonical frame
+    :param transform: transform returned by canonicalize()
+    :return: (x, y) in the game frame
+    """
+    cell = PERMUTATIONS[INVERSE[transform]][3*move[0] + move[1]]
+    return cell // 3, cell % 3
+
+def unique_moves(game: TicTacToe) -> List[List[int]]:
+    """
+    Empty cells of the game with one move per class of symmetric moves, i.e. moves that lead to symmetric positions.
+    The representative of each class is its first cell in row-major order, so the result is a row-major subset of empty_cells().
+    :param game: Tic Tac Toe game
+    :return: a list of empty cells
+    """
+    x_bits, o_bits = game.x_bits, game.o_bits
+    stabiliser = [PERMUTATIONS[t] for t in range(1, 8) if MASK_TABLE[t][x_bits] == x_bits and MASK_TABLE[t][o_bits] == o_bits]
+    cells = []
+    for x, y in game.empty_cells():
+        cell = 3*x + y
+        if all(perm[cell] >= cell for perm in stabiliser):
+            cells.append([x, y])
+    return cells
@@ -1,98 +1,343 @@
-"""
-TODO: Implement the AlphaBetaPlayer class. The only difference from Minima is the addition of alpha-beta pruning.
-* Note: You should read the game logic in project/game.py to familiarize yourself with the environment.
-"""
-import random
-import math
-from ..player import Player
-from ..game import TicTacToe
-
-class TTT_AlphaBetaPlayer(Player):
-    def __init__(self, letter):
-        super().__init__(letter)
-
-    def get_move(self, game: TicTacToe):
-        depth = len(game.empty_cells())
-        if depth == 0 or game.game_over():
-            return
-        
-        if len(game.empty_cells()) == 9:
-            move = random.choice(game.empty_cells())
-        else:
-            # Alpha-Beta Pruning: Initialize alpha to negative infinity and beta to positive infinity
-            alpha = -math.inf
-            beta = math.inf
-            choice = self.minimax(game, depth, self.letter, alpha, beta)
-            move = [choice[0], choice[1]]
-        return move
-
-    def minimax(self, game: TicTacToe, depth: int, player_letter: str, alpha: float, beta: float):
-        """
-        AI function that chooses the best move with alpha-beta pruning.
-        :param game: current game state
-        :param depth: node index in the tree (0 <= depth <= 9)
-        :param player_letter: value representing the player
-        :param alpha: best value that the maximizer can guarantee
-        :param beta: best value that the minimizer can guarantee
-        :return: [row, col, best_score] of the selected move
-        """
-        opponent = "X" if player_letter == "O" else "O"
-        
-        if game.game_over() or depth == 0:
-            return [-1, -1, self.evaluate(game)]
-        
-        if player_letter == self.letter:
-            best_score = -math.inf
-            best = [-1, -1, best_score]
-            for cell in game.empty_cells(state=game.board_state):
-                next_x, next_y = cell
-                temp_game = game.copy()
-                temp_game.set_move(next_x, next_y, player_letter)
-                _, _, score = self.minimax(temp_game, depth - 1, opponent, alpha, beta)
-                
-                if score > best_score:
-                    best_score = score
-                    best = [next_x, next_y, best_score]
-                
-                # Alpha-Beta Pruning
-                alpha = max(alpha, best_score)
-                if beta <= alpha:
-                    break
-            return best
-        else:
-            best_score = math.inf
-            best = [-1, -1, best_score]
-            for cell in game.empty_cells(state=game.board_state):
-                next_x, next_y = cell
-                temp_game = game.copy()
-                temp_game.set_move(next_x, next_y, player_letter)
-                _, _, score = self.minimax(temp_game, depth - 1, opponent, alpha, beta)
-                
-                if score < best_score:
-                    best_score = score
-                    best = [next_x, next_y, best_score]
-                
-                # Alpha-Beta Pruning
-                beta = min(beta, best_score)
-                if beta <= alpha:
-                    break
-            return best
-        
-    
-    def evaluate(self, game: TicTacToe) -> int:
-        """
-        Function to evaluate the score of game state.
-        :param game: the game state to evaluate
-        :return: the score of the board from the perspective of current player
-        """
-        if game.wins(self.letter):
-            return 1
-        
-        opponent = "X" if self.letter == "O" else "O"
-        if game.wins(opponent):
-            return -1
-        
-        return 0
-    
-    def __str__(self) -> str:
+"""
+TODO: Implement the AlphaBetaPlayer class. The only difference from Minima is the addition of alpha-beta pruning.
+* Note: You should read the game logic in project/game.py to familiarize yourself with the environment.
+"""
+import random
+import math
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from ..player import Player
+from ..game import TicTacToe, MNKGame
+from ..evaluation import PatternEvaluator
+from ..encoding import encode, decode
+from ..transposition import TranspositionTable, TT_SIZE, EXACT, LOWER, UPPER
+from ..move_ordering import MoveOrdering, HEURISTICS
+from .oracle import load_table, lookup
+
+WIN_SCORE = 1
+DEADLINE_CHECK_INTERVAL = 256 # Nodes between two reads of the clock
+NULL_WINDOW = 1e-6 # Width of the zero window of principal variation search; scores are not integers with a pattern evaluation
+ASPIRATION_WINDOW = 0.25 # Half width of the root window around the score of the previous iteration
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the deadline has passed, to unwind to get_move().
+    """
+    pass
+
+#* State of a worker process of the parallel search, set by _init_worker()
+_worker = None
+_shared_alpha = None
+
+def _init_worker(shared_alpha, tt_size, move_ordering, max_depth, pvs):
+    global _worker, _shared_alpha
+    _worker = TTT_AlphaBetaPlayer('X', tt_size=tt_size, move_ordering=move_ordering, max_depth=max_depth, pvs=pvs)
+    _shared_alpha = shared_alpha
+
+def _search_root_move(code, move, depth, letter, deadline):
+    """
+    Search one root move in a worker process. The search starts from the best root score found so far by any worker,
+    and a better score is published for the moves searched after it.
+    :param code: encoded root position, see project/encoding.py
+    :param move: root move to search
+    :param depth: remaining depth at the root
+    :param letter: the searching player's letter
+    :param deadline: time.time() at which to give up, or None
+    :return: (score or None if time ran out, alpha the search started from, nodes searched, re-searches)
+    """
+    game = decode(code)
+    if isinstance(game, MNKGame):
+        game.evaluator = PatternEvaluator(game)
+    player = _worker
+    player.letter = letter
+    # Every task is a new search for the worker: age its table and heuristics as get_move() does
+    if player.tt is not None:
+        player.tt.new_search()
+    player.ordering.new_search()
+    nodes, re_searches = player.nodes, player.re_searches
+    alpha = _shared_alpha.value
+    game.push(move)
+    player.deadline = deadline
+    try:
+        _, _, score = player.minimax(game, depth - 1, game.curr_player, -math.inf, -alpha, ply=1)
+    except SearchTimeout:
+        return None, alpha, player.nodes - nodes, player.re_searches - re_searches
+    finally:
+        player.deadline = None
+    score = -score
+    with _shared_alpha.get_lock():
+        if score > _shared_alpha.value:
+            _shared_alpha.value = score
+    return score, alpha, player.nodes - nodes, player.re_searches - re_searches
+
+class TTT_AlphaBetaPlayer(Player):
+    def __init__(self, letter, tt_size=TT_SIZE, oracle=False, move_ordering=HEURISTICS, time_limit=None, max_depth=None, workers=1,
+                 pvs=False, aspiration_window=ASPIRATION_WINDOW):
+        """
+        :param tt_size: number of transposition table slots (a power of two), or 0 to search without a table.
+            The table is kept for the lifetime of the player, so it persists across moves and games.
+        :param oracle: answer from the perfect-play table instead of searching
+        :param move_ordering: move ordering heuristics to use, see project/move_ordering.py. () searches in row-major order.
+        :param time_limit: seconds per move for iterative deepening. The move of the last completed depth is played when time runs out.
+            None searches to the end of the game in one pass.
+        :param max_depth: maximum search depth in moves, None for no limit.
+            On an m,n,k board, positions at the depth limit are scored by the pattern evaluation of project/evaluation.py.
+        :param workers: number of processes for the root-parallel search, 1 searches in this process only
+        :param pvs: principal variation search: the first move of a node gets the full window, the others a zero window,
+            and are searched again with the full window only if they turn out better
+        :param aspiration_window: half width of the root window of each iteration around the previous score, in PVS mode with a time limit
+            and one worker. None searches every iteration with the full window.
+        """
+        super().__init__(letter)
+        self.oracle = oracle
+        if self.oracle:
+            load_table()
+        self.tt = TranspositionTable(tt_size) if tt_size else None
+        self.move_ordering = move_ordering
+        self.ordering = MoveOrdering(move_ordering)
+        self.nodes = 0 # Number of positions searched, for measuring the effect of the table and move ordering
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.deadline = None
+        self.depth_reached = 0 # Depth of the last completed iteration of the last move
+        self.depths = [] # depth_reached of every searched move
+        self.workers = workers
+        self.pool = None # Worker processes, started by the first parallel search and kept for the lifetime of the player
+        self.shared_alpha = None
+        self.pvs = pvs
+        self.aspiration_window = aspiration_window
+        self.re_searches = 0 # Zero-window searches that failed high and were searched again
+        self.aspiration_fails = 0 # Iterations searched again with the full window
+
+    def get_move(self, game: TicTacToe):
+        depth = len(game.empty_cells())
+        if depth == 0 or game.game_over():
+            return
+        
+        if game.num_moves == 0 and isinstance(game, MNKGame):
+            move = [game.m // 2, game.n // 2] # The centre is the strongest opening on an m,n,k board
+        elif game.num_moves == 0:
+            move = random.choice(game.empty_cells())
+        elif self.oracle:
+            move = lookup(game)[1][0]
+        else:
+            if self.tt is not None:
+                self.tt.new_search()
+            self.ordering.new_search()
+            if self.max_depth is not None:
+                depth = min(depth, self.max_depth)
+            # Search on one private copy; minimax() plays and undoes moves on it in place
+            search_game = game.copy()
+            if isinstance(search_game, MNKGame):
+                # Score unfinished positions incrementally and search only the moves near the stones
+                search_game.evaluator = PatternEvaluator(search_game)
+            if self.time_limit is None:
+                choice = self.search(search_game, depth)
+                self.depth_reached = depth
+            else:
+                choice = self.iterative_deepening(search_game, depth)
+            self.depths.append(self.depth_reached)
+            move = [choice[0], choice[1]]
+        return move
+
+    def iterative_deepening(self, game: TicTacToe, max_depth: int):
+        """
+        Search to depth 1, 2, ... until max_depth or the time limit. Each iteration starts with the best moves of the previous one
+        through the transposition table. When time runs out, the result of the last completed depth is returned.
+        :param game: private copy of the current game state
+        :param max_depth: deepest iteration
+        :return: [row, col, best_score] of the selected move
+        """
+        self.deadline = time.time() + self.time_limit
+        root_moves = len(game.move_stack)
+        # Fall back to the most promising move by the static ordering if not even depth 1 completes
+        fallback = self.ordering.order(game, self.moves(game), 0)[0]
+        best = [fallback[0], fallback[1], 0]
+        self.depth_reached = 0
+        try:
+            for depth in range(1, max_depth + 1):
+                # The parallel search always uses the full window, so it gets no aspiration window
+                if self.pvs and self.aspiration_window is not None and self.workers == 1 and depth > 1 and abs(best[2]) < WIN_SCORE:
+                    alpha, beta = best[2] - self.aspiration_window, best[2] + self.aspiration_window
+                    choice = self.search(game, depth, alpha, beta)
+                    if not alpha < choice[2] < beta:
+                        # The score is only a bound outside the window, so its move is kept only once the re-search completes
+                        self.aspiration_fails += 1
+                        choice = self.search(game, depth)
+                    best = choice
+                else:
+                    best = self.search(game, depth)
+                self.depth_reached = depth
+                if abs(best[2]) >= WIN_SCORE:
+                    break # A forced win or loss does not change with more depth
+        except SearchTimeout:
+            # Undo the moves of the interrupted iteration
+            while len(game.move_stack) > root_moves:
+                game.pop()
+        finally:
+            self.deadline = None
+        return best
+
+    def search(self, game: TicTacToe, depth: int, alpha: float = -math.inf, beta: float = math.inf):
+        """
+        Search the root position to the given depth, in parallel if the player has workers.
+        The parallel search always uses the full window.
+        :return: [row, col, best_score] of the selected move
+        """
+        if self.workers > 1:
+            return self.parallel_search(game, depth)
+        # Alpha-Beta Pruning: Initialize alpha to negative infinity and beta to positive infinity
+        return self.minimax(game, depth, self.letter, alpha, beta)
+
+    def parallel_search(self, game: TicTacToe, depth: int):
+        """
+        Root-parallel search in the Young Brothers Wait style: the first root move is searched here to get a good alpha,
+        then the other root moves are searched by the worker processes, which share the best root score found so far.
+        Scores that failed low against that shared alpha are only upper bounds, so they never replace the best move.
+        :param game: private copy of the current game state
+        :param depth: remaining depth at the root
+        :return: [row, col, best_score] of the selected move, as minimax() would score it
+        """
+        if self.pool is None:
+            self.shared_alpha = multiprocessing.Value('d', -math.inf)
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                            initargs=(self.shared_alpha, self.tt.size if self.tt else 0, self.move_ordering, self.max_depth, self.pvs))
+        entry = self.tt.lookup(game.hash_key) if self.tt is not None else None
+        moves = self.ordering.order(game, self.moves(game), 0, entry[2] if entry else None)
+        
+        first = moves[0]
+        game.push(first)
+        _, _, score = self.minimax(game, depth - 1, game.curr_player, -math.inf, math.inf, ply=1)
+        game.pop()
+        best = [first[0], first[1], -score]
+        if len(moves) == 1 or best[2] >= WIN_SCORE:
+            return best
+        
+        self.shared_alpha.value = best[2]
+        code = encode(game)
+        futures = [self.pool.submit(_search_root_move, code, (x, y), depth, self.letter, self.deadline) for x, y in moves[1:]]
+        timed_out = False
+        for (x, y), future in zip(moves[1:], futures):
+            score, alpha, nodes, re_searches = future.result()
+            self.nodes += nodes
+            self.re_searches += re_searches
+            if score is None:
+                timed_out = True
+            elif score > alpha and score > best[2]:
+                best = [x, y, score]
+        if timed_out:
+            raise SearchTimeout()
+        return best
+
+    def close(self):
+        """
+        Shut down the worker processes of the parallel search.
+        """
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def minimax(self, game: TicTacToe, depth: int, player_letter: str, alpha: float, beta: float, ply: int = 0):
+        """
+        AI function that chooses the best move with alpha-beta pruning, in negamax form with a transposition table.
+        Scores are from the perspective of player_letter (the player to move), so table entries stay valid when the player's letter changes.
+        :param game: current game state
+        :param depth: node index in the tree (0 <= depth <= 9)
+        :param player_letter: value representing the player to move
+        :param alpha: best value that the player to move can guarantee
+        :param beta: best value that the opponent can guarantee, from the perspective of the player to move
+        :param ply: distance from the root of the search (0 at the root)
+        :return: [row, col, best_score] of the selected move
+        """
+        self.nodes += 1
+        if self.deadline is not None and self.nodes % DEADLINE_CHECK_INTERVAL == 0 and time.time() > self.deadline:
+            raise SearchTimeout()
+        if game.game_over() or depth == 0:
+            score = self.evaluate(game)
+            return [-1, -1, score if player_letter == self.letter else -score]
+        
+        # Transposition table: reuse an exact value or narrow the window with a stored bound.
+        # The root always searches its moves, since a narrowed window there would not tell which move is best.
+        key = game.hash_key
+        tt_move = None
+        if self.tt is not None:
+            entry = self.tt.lookup(key)
+            if entry is not None:
+                value, entry_depth, tt_move, flag = entry
+                if entry_depth >= depth and ply > 0:
+                    if flag == EXACT:
+                        return [tt_move[0], tt_move[1], value]
+                    elif flag == LOWER:
+                        alpha = max(alpha, value)
+                    else:
+                        beta = min(beta, value)
+                    if alpha >= beta:
+                        return [tt_move[0], tt_move[1], value]
+        alpha_orig = alpha
+        
+        opponent = "X" if player_letter == "O" else "O"
+        best_score = -math.inf
+        best = [-1, -1, best_score]
+        for i, cell in enumerate(self.ordering.order(game, self.moves(game), ply, tt_move)):
+            next_x, next_y = cell
+            game.push(cell)
+            if i == 0 or not self.pvs:
+                _, _, score = self.minimax(game, depth - 1, opponent, -beta, -alpha, ply + 1)
+            else:
+                # Principal variation search: only prove that the move is not better than alpha
+                _, _, score = self.minimax(game, depth - 1, opponent, -alpha - NULL_WINDOW, -alpha, ply + 1)
+                if alpha < -score < beta:
+                    self.re_searches += 1
+                    _, _, score = self.minimax(game, depth - 1, opponent, -beta, -alpha, ply + 1)
+            game.pop()
+            score = -score
+            
+            if score > best_score:
+                best_score = score
+                best = [next_x, next_y, best_score]
+            
+            # Alpha-Beta Pruning
+            alpha = max(alpha, best_score)
+            if beta <= alpha:
+                self.ordering.cutoff(cell, ply, depth)
+                break
+        
+        if self.tt is not None:
+            if best_score <= alpha_orig:
+                flag = UPPER
+            elif best_score >= beta:
+                flag = LOWER
+            else:
+                flag = EXACT
+            self.tt.store(key, best_score, depth, (best[0], best[1]), flag)
+        return best
+        
+    def moves(self, game: TicTacToe):
+        """
+        Moves to search from the game state: the cells near the stones when a pattern evaluator is attached, otherwise all empty cells.
+        """
+        if game.evaluator is not None:
+            return game.evaluator.candidate_moves(game)
+        return game.empty_cells()
+    
+    def evaluate(self, game: TicTacToe) -> float:
+        """
+        Function to evaluate the score of game state.
+        :param game: the game state to evaluate
+        :return: the score of the board from the perspective of current player.
+            +-1 for a win or loss, otherwise the pattern evaluation in (-1, 1) if the game has an evaluator, or 0
+        """
+        if game.wins(self.letter):
+            return WIN_SCORE
+        
+        opponent = "X" if self.letter == "O" else "O"
+        if game.wins(opponent):
+            return -WIN_SCORE
+        
+        if game.evaluator is not None:
+            return game.evaluator.evaluate(self.letter)
+        return 0
+    
+    def __str__(self) -> str:
         return "Alpha-Beta Player"
\ No newline at end of file
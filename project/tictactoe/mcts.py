@@ -1,127 +1,538 @@
-"""
-TODO: Implement the TreeNode for TTT_MCTSPlayer class.
-* Note 1: You should read the game logic in project/game.py to familiarize yourself with the environment.
-* Note 2: You don't have to strictly follow the template or even use it at all. Feel free to create your own implementation.
-"""
-
-import numpy as np
-import math
-import random
-
-from ..player import Player
-from ..game import TicTacToe
-
-WIN = 1
-LOSE = -1
-DRAW = 0
-NUM_SIMULATIONS = 5000
-EXPLORATION_CONSTANT = math.sqrt(2)
-
-class TreeNode():
-    def __init__(self, game_state: TicTacToe, player_letter: str, parent=None, parent_action=None):
-        self.player = player_letter
-        self.game_state = game_state
-        self.parent = parent
-        self.parent_action = parent_action
-        self.children = []
-        self.N = 0
-        self.Q = 0
-    
-    def select(self) -> 'TreeNode':
-        """
-        Select the best child node based on UCB1 formula. Keep selecting until a leaf node is reached.
-        """
-        current_node = self
-        while not current_node.is_leaf_node():
-            current_node = current_node.best_child()
-        return current_node
-    
-    def expand(self) -> 'TreeNode':
-        """
-        Expand the current node by adding all possible child nodes. Return one of the child nodes for simulation.
-        """
-        if self.is_terminal_node():
-            return self
-            
-        for cell in self.game_state.empty_cells():
-            x, y = cell
-            temp_game = self.game_state.copy()
-            temp_game.set_move(x, y, self.game_state.curr_player)
-            next_player = 'O' if self.player == 'X' else 'X'
-            child_node = TreeNode(
-                game_state=temp_game,
-                player_letter=next_player,
-                parent=self,
-                parent_action=(x, y)
-            )
-            self.children.append(child_node)
-        
-        return random.choice(self.children)
-    
-    def simulate(self) -> int:
-        """
-        Run simulation from the current node until the game is over. Return the result of the simulation.
-        """
-        sim_game = self.game_state.copy()
-        
-        while not sim_game.game_over():
-            empty_cells = sim_game.empty_cells()
-            if not empty_cells:
-                break
-            x, y = random.choice(empty_cells)
-            sim_game.set_move(x, y, sim_game.curr_player)
-        
-        if sim_game.wins(self.player):
-            return WIN
-        
-        if sim_game.wins('O' if self.player == 'X' else 'X'):
-            return LOSE
-        
-        return DRAW
-    
-    def backpropagate(self, result: int):
-        """
-        Backpropagate the result of the simulation to the root node.
-        """
-        self.N += 1
-        self.Q += result
-        
-        if self.parent is not None:
-            self.parent.backpropagate(-result)
-
-            
-    def is_leaf_node(self) -> bool:
-        return len(self.children) == 0
-    
-    def is_terminal_node(self) -> bool:
-        return self.game_state.game_over()
-    
-    def best_child(self) -> 'TreeNode':
-        return max(self.children, key=lambda c: c.ucb())
-    
-    def ucb(self, c=EXPLORATION_CONSTANT) -> float:
-        if self.N == 0:
-            return float('inf')
-        return self.Q / self.N + c * np.sqrt(np.log(self.parent.N) / self.N)
-    
-class TTT_MCTSPlayer(Player):
-    def __init__(self, letter, num_simulations=NUM_SIMULATIONS):
-        super().__init__(letter)
-        self.num_simulations = num_simulations
-        self.exploration_constant = EXPLORATION_CONSTANT
-    
-    def get_move(self, game):
-        mcts = TreeNode(game, self.letter)
-        for _ in range(self.num_simulations):
-            leaf = mcts.select()
-            if not leaf.is_terminal_node():
-                leaf.expand()
-            # Default simulation starts from an expanded node of leaf. However, we can also start simulation from leaf itself to avoid complicating the code.
-            result = leaf.simulate() 
-            leaf.backpropagate(-result) # Negate the result because it's from the perspective of the opponent
-            
-        best_child = max(mcts.children, key=lambda c: c.N)
-        return best_child.parent_action
-    
-    def __str__(self) -> str:
-        return "MCTS Player"
\ No newline at end of file
+"""
+TODO: Implement the TreeNode for TTT_MCTSPlayer class.
+* Note 1: You should read the game logic in project/game.py to familiarize yourself with the environment.
+* Note 2: You don't have to strictly follow the template or even use it at all. Feel free to create your own implementation.
+"""
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+import numpy as np
+
+from ..player import Player
+from ..game import TicTacToe, STONES
+from ..batch import BatchTicTacToe
+from ..symmetry import unique_moves
+from ..encoding import encode, decode
+from .mcts_array import ArrayTree
+from .mcts_dag import DagTree
+
+WIN = 1
+LOSE = -1
+DRAW = 0
+NUM_SIMULATIONS = 5000
+EXPLORATION_CONSTANT = math.sqrt(2)
+# One TreeNode object per node, the NumPy arrays of project/tictactoe/mcts_array.py,
+# or the transposition table of positions of project/tictactoe/mcts_dag.py
+ENGINES = ('node', 'array', 'dag')
+TREES = {'array': ArrayTree, 'dag': DagTree}
+PARALLEL_MODES = ('root', 'leaf')
+LEAF_BATCH = 8
+# New simulations before the anytime mode estimates its remaining budget; until then the solver does not stop early
+MIN_RATE_SIMULATIONS = 100
+RAVE_EQUIVALENCE = 300 # Visits at which the AMAF value and the UCT value weigh about the same in RAVE
+
+class TreeNode():
+    # Nodes are plentiful (tens of thousands per move), so they have no __dict__ and hold no board copy
+    __slots__ = ('player', 'game_state', 'parent', 'parent_action', 'children', 'N', 'Q', 'use_symmetry', 'proof', 'AN', 'AQ', 'rave')
+    
+    def __init__(self, game_state: TicTacToe, player_letter: str, parent=None, parent_action=None, use_symmetry=False, rave=None):
+        """
+        :param game_state: the game shared by the whole tree. It is positioned at this node while the node is visited.
+        :param player_letter: the player to move at this node
+        :param parent_action: the move that leads from the parent to this node
+        :param rave: equivalence parameter of the RAVE schedule, None for plain UCB1
+        """
+        self.player = player_letter
+        self.game_state = game_state
+        self.parent = parent
+        self.parent_action = parent_action
+        self.children = () # Replaced by a list on expansion
+        self.N = 0
+        self.Q = 0
+        self.use_symmetry = use_symmetry # Expand one child per class of symmetric moves
+        self.proof = None # Proven WIN, DRAW or LOSE for the player who moved into this node (MCTS-Solver), None if unknown
+        # All-moves-as-first statistics of parent_action: simulations through the parent in which the player to move there
+        # played this move at any later point, and their results for that player
+        self.AN = 0
+        self.AQ = 0
+        self.rave = rave
+    
+    def select(self) -> 'TreeNode':
+        """
+        Select the best child node based on UCB1 formula. Keep selecting until a leaf node is reached.
+        The moves along the path are pushed onto the shared game state, and backpropagate() pops them again.
+        """
+        current_node = self
+        while not current_node.is_leaf_node():
+            current_node = current_node.best_child()
+            self.game_state.push(current_node.parent_action)
+        return current_node
+    
+    def expand(self) -> 'TreeNode':
+        """
+        Expand the current node by adding all possible child nodes. Return one of the child nodes for simulation.
+        The shared game state stays at the current node.
+        """
+        if self.is_terminal_node():
+            return self
+            
+        moves = unique_moves(self.game_state) if self.use_symmetry else self.game_state.empty_cells()
+        next_player = 'O' if self.player == 'X' else 'X'
+        self.children = [
+            TreeNode(
+                game_state=self.game_state,
+                player_letter=next_player,
+                parent=self,
+                parent_action=(x, y),
+                use_symmetry=self.use_symmetry,
+                rave=self.rave
+            )
+            for x, y in moves
+        ]
+        
+        return random.choice(self.children)
+    
+    def simulate(self, played: Optional[Dict[Tuple[int, int], str]] = None) -> int:
+        """
+        Run simulation from the current node until the game is over. Return the result of the simulation.
+        :param played: if given, the moves of the rollout are added to it with the letter of the player who made them
+        """
+        # Play the rollout in place on the shared state and undo it afterwards
+        sim_game = self.game_state
+        num_moves = 0
+        
+        # game_over() is an O(1) read of the tracked status, so it also covers the full-board check
+        while not sim_game.game_over():
+            x, y = random.choice(sim_game.empty_cells())
+            if played is not None:
+                played[(x, y)] = sim_game.curr_player
+            sim_game.push((x, y))
+            num_moves += 1
+        
+        if sim_game.winner is None:
+            result = DRAW
+        elif sim_game.winner == self.player:
+            result = WIN
+        else:
+            result = LOSE
+        
+        for _ in range(num_moves):
+            sim_game.pop()
+        return result
+    
+    def backpropagate(self, result: int, visits: int = 1):
+        """
+        Backpropagate the result of the simulation to the root node, popping the moves that select() pushed.
+        If this node is proven, the proof is propagated to the ancestors as far as it decides them.
+        :param result: result, or sum of the results of several rollouts, for the player who moved into this node
+        :param visits: number of rollouts in result
+        """
+        node = self
+        proving = self.proof is not None
+        while node is not None:
+            node.N += visits
+            node.Q += result
+            result = -result
+            if node.parent is not None:
+                self.game_state.pop()
+                if proving:
+                    proving = node.parent.prove()
+            node = node.parent
+    
+    def update_amaf(self, played: Dict[Tuple[int, int], str], result: int):
+        """
+        Update the all-moves-as-first statistics of the children of every node from this leaf to the root.
+        A child is updated if the player to move at its parent played its move later in the simulation, in the tree or in the rollout.
+        :param played: moves of the rollout from this leaf, with the letter of the player who made them
+        :param result: result of the simulation for the player to move at this leaf
+        """
+        node = self
+        while node.parent is not None:
+            played[node.parent_action] = node.parent.player
+            node = node.parent
+        # Moves above a node are occupied there, so they never match one of its children
+        node = self
+        while node is not None:
+            value = result if node.player == self.player else -result
+            for child in node.children:
+                if played.get(child.parent_action) == node.player:
+                    child.AN += 1
+                    child.AQ += value
+            node = node.parent
+    
+    def prove(self) -> bool:
+        """
+        Prove this node from its children, as in minimax: a child won by the player to move here is a loss for the player
+        who moved into this node, otherwise all children must be proven.
+        :return: whether the node is proven
+        """
+        best = LOSE # Best proven result of the children for the player to move here
+        for child in self.children:
+            if child.proof is None:
+                best = None
+            elif child.proof == WIN:
+                self.proof = LOSE
+                return True
+            elif best is not None:
+                best = max(best, child.proof)
+        if best is None:
+            return False
+        self.proof = -best
+        return True
+            
+    def child_reaching(self, game: TicTacToe) -> 'TreeNode':
+        """
+        Find the child whose position is the position of game, comparing hash keys.
+        :return: the child, or None if there is none
+        """
+        for child in self.children:
+            self.game_state.push(child.parent_action)
+            found = self.game_state.hash_key == game.hash_key
+            self.game_state.pop()
+            if found:
+                return child
+        return None
+    
+    def make_root(self):
+        """
+        Detach this node from its parent and play its move on the shared game state, so that it can be searched as a root.
+        """
+        self.parent = None
+        self.game_state.push(self.parent_action)
+    
+    def subtree_size(self) -> int:
+        """
+        Number of nodes in the subtree of this node, the node included.
+        """
+        size, stack = 0, [self]
+        while stack:
+            node = stack.pop()
+            size += 1
+            stack.extend(node.children)
+        return size
+            
+    def is_leaf_node(self) -> bool:
+        return len(self.children) == 0
+    
+    def is_terminal_node(self) -> bool:
+        return self.game_state.game_over()
+    
+    def best_child(self) -> 'TreeNode':
+        # Proven children are not searched any more. An unproven node always has an unproven child.
+        return max((c for c in self.children if c.proof is None), key=lambda c: c.ucb())
+    
+    def most_visited_child(self) -> 'TreeNode':
+        """
+        Child to play: a proven win if there is one, otherwise the most visited child that is not a proven loss.
+        """
+        return max(self.children, key=lambda c: (c.proof == WIN, c.proof != LOSE, c.N))
+    
+    def ucb(self, c=EXPLORATION_CONSTANT) -> float:
+        if self.N == 0:
+            return float('inf')
+        value = self.Q / self.N
+        if self.rave is not None and self.AN:
+            # RAVE: the AMAF value counts most while the node has few visits of its own
+            beta = math.sqrt(self.rave / (3 * self.N + self.rave))
+            value = (1 - beta) * value + beta * self.AQ / self.AN
+        return value + c * math.sqrt(math.log(self.parent.N) / self.N)
+    
+#* Worker processes of the parallel modes
+def _init_worker():
+    random.seed() # Forked workers would otherwise all play the same rollouts
+
+def _root_visits(code, letter, num_simulations, use_symmetry, engine, rollouts, deadline, solver, rave, rave_equivalence):
+    """
+    Build an independent tree in a worker process, for root parallelism.
+    :param code: encoded root position, see project/encoding.py
+    :param deadline: time.time() at which the search stops in the anytime mode, None to run num_simulations
+    :return: (visit counts of the root's children by move, simulations, nodes added to the tree, nodes in the tree)
+    """
+    player = TTT_MCTSPlayer(letter, num_simulations, use_symmetry=use_symmetry, engine=engine, reuse_tree=False, rollouts=rollouts,
+                            solver=solver, rave=rave, rave_equivalence=rave_equivalence)
+    player.deadline = deadline
+    return player.root_visits(decode(code)), player.simulations, player.new_nodes, player.tree_size
+
+def _leaf_rollouts(code, num_rollouts):
+    """
+    Play random rollouts from a leaf in a worker process, for leaf parallelism.
+    :param code: encoded leaf position, see project/encoding.py
+    :return: sum of the results for the player to move at the leaf
+    """
+    game = decode(code)
+    leaf = TreeNode(game, game.curr_player)
+    return sum(leaf.simulate() for _ in range(num_rollouts))
+
+class TTT_MCTSPlayer(Player):
+    def __init__(self, letter, num_simulations=NUM_SIMULATIONS, use_symmetry=False, engine='node', reuse_tree=True,
+                 workers=1, parallel='root', leaf_batch=LEAF_BATCH, rollouts=1, time_limit=None, solver=True, rave=False,
+                 rave_equivalence=RAVE_EQUIVALENCE):
+        """
+        :param num_simulations: number of visits of the root before a move is chosen, including visits kept from the previous move.
+            Every rollout counts as a visit.
+        :param engine: tree implementation, one of ENGINES
+        :param reuse_tree: keep the subtree of the chosen move, and search from the opponent's reply in it on the next call
+        :param workers: number of worker processes, 1 searches in this process only
+        :param parallel: one of PARALLEL_MODES. 'root': every worker builds its own tree with an equal share of the simulations,
+            and the visit counts of the root's children are added up. Trees are not reused in this mode.
+            'leaf': one tree, and every worker plays leaf_batch rollouts from each selected leaf.
+        :param leaf_batch: rollouts per worker and leaf in the 'leaf' mode
+        :param rollouts: number of random rollouts from every new leaf, backpropagated as one update weighted by their number.
+            Tic Tac Toe plays them at once with BatchTicTacToe; other games play them one by one. Not used in the 'leaf' mode.
+        :param time_limit: seconds per move for the anytime mode, which simulates until the time is up instead of num_simulations.
+            It should leave a margin below the move timeout, see TIME_LIMIT_SHARE in project/__init__.py.
+        :param solver: MCTS-Solver. Game-over nodes are proven and the proofs are propagated up the tree; proven subtrees are
+            not searched again, and the search stops when the root is proven or its most visited child can no longer be overtaken.
+        :param rave: RAVE. Every simulation also updates the all-moves-as-first statistics of the moves it played, and selection
+            blends them into the UCT value with the weight beta = sqrt(k / (3 N + k)), which fades as the node gets visits.
+            Needs the node engine and one rollout per leaf, since the batched and leaf-parallel rollouts do not report their moves.
+        :param rave_equivalence: k of the RAVE schedule. A larger k trusts the AMAF values for longer.
+        """
+        super().__init__(letter)
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown MCTS engine {engine}. Please choose from {ENGINES}")
+        if parallel not in PARALLEL_MODES:
+            raise ValueError(f"Unknown parallel mode {parallel}. Please choose from {PARALLEL_MODES}")
+        if rave and (engine != 'node' or rollouts > 1 or workers > 1 and parallel == 'leaf'):
+            raise ValueError("RAVE needs the node engine and one rollout per leaf")
+        self.num_simulations = num_simulations
+        self.exploration_constant = EXPLORATION_CONSTANT
+        self.use_symmetry = use_symmetry
+        self.engine = engine
+        self.reuse_tree = reuse_tree
+        self.tree = None # Subtree of the last chosen move, positioned after that move
+        self.reused_visits = 0 # Root visits kept from the previous move
+        self.workers = workers
+        self.parallel = parallel
+        self.leaf_batch = leaf_batch
+        self.pool = None # Worker processes, started by the first parallel search and kept for the lifetime of the player
+        self.rollouts = rollouts
+        self.batch = None # BatchTicTacToe of the batched rollouts, created on first use
+        self.time_limit = time_limit
+        self.deadline = None # time.time() at which the current search stops in the anytime mode
+        # Report of the last move: simulations run (without reused visits), nodes added to the tree,
+        # nodes the tree holds at the end of the search (reused ones included), simulations per second.
+        # The arrays and the table of the other engines keep the nodes left above the root by earlier moves, and count them.
+        self.simulations = 0
+        self.new_nodes = 0
+        self.tree_size = 0
+        self.simulation_rate = 0.0
+        self.move_stats = [] # (simulations, new_nodes, tree_size, simulation_rate) of every move
+        self.solver = solver
+        self.search_start = 0.0
+        self.rave = rave
+        self.rave_equivalence = rave_equivalence
+    
+    def get_move(self, game):
+        start = time.time()
+        self.deadline = start + self.time_limit if self.time_limit is not None else None
+        move = self.search_move(game)
+        elapsed = time.time() - start
+        self.simulation_rate = self.simulations / elapsed if elapsed > 0 else 0.0
+        self.move_stats.append((self.simulations, self.new_nodes, self.tree_size, self.simulation_rate))
+        return move
+    
+    def search_move(self, game):
+        """
+        Search the position and choose the most visited child of the root.
+        """
+        if self.workers > 1 and self.parallel == 'root':
+            return self.root_parallel_move(game)
+        
+        if self.engine in TREES:
+            tree = self.tree_search(game)
+            move = tree.best_move()
+            if self.reuse_tree:
+                tree.descend(tree.best_child())
+                self.tree = tree
+            return move
+        
+        mcts = self.node_search(game)
+        best_child = mcts.most_visited_child()
+        if self.reuse_tree:
+            best_child.make_root()
+            self.tree = best_child
+        return best_child.parent_action
+    
+    def node_search(self, game) -> TreeNode:
+        """
+        Run the simulations on a tree of TreeNodes.
+        :return: the root
+        """
+        # Warm start from the subtree of the opponent's reply, if the game went on from our last move
+        mcts = self.tree.child_reaching(game) if self.reuse_tree and self.tree is not None else None
+        self.tree = None
+        if mcts is not None:
+            mcts.make_root()
+        else:
+            # The whole tree shares one private copy of the game
+            mcts = TreeNode(game.copy(), self.letter, use_symmetry=self.use_symmetry, rave=self.rave_equivalence if self.rave else None)
+        self.reused_visits = mcts.N
+        self.new_nodes = 0
+        self.search_start = time.time()
+        rollout = self.rollout_function()
+        # The root is expanded at least once, even if the deadline has already passed
+        while not mcts.children or self.searching(mcts.N) and not (self.solver and self.node_decided(mcts)):
+            leaf = mcts.select()
+            if not leaf.is_terminal_node():
+                leaf.expand()
+                self.new_nodes += len(leaf.children)
+            # Default simulation starts from an expanded node of leaf. However, we can also start simulation from leaf itself to avoid complicating the code.
+            if rollout is not None and not leaf.is_terminal_node():
+                result, visits = rollout(leaf.game_state)
+                leaf.backpropagate(-result, visits)
+            elif self.rave:
+                played = {}
+                result = leaf.simulate(played)
+                if self.solver and leaf.is_terminal_node():
+                    leaf.proof = -result
+                leaf.update_amaf(played, result)
+                leaf.backpropagate(-result)
+            else:
+                result = leaf.simulate() 
+                if self.solver and leaf.is_terminal_node():
+                    leaf.proof = -result
+                leaf.backpropagate(-result) # Negate the result because it's from the perspective of the opponent
+        self.simulations = mcts.N - self.reused_visits
+        self.tree_size = mcts.subtree_size()
+        return mcts
+    
+    def tree_search(self, game):
+        """
+        Run the simulations on the ArrayTree or DagTree of the engine.
+        :return: the tree
+        """
+        tree = self.tree if self.reuse_tree else None
+        self.tree = None
+        if tree is None or not tree.descend_to(game):
+            tree = TREES[self.engine](game.copy(), self.exploration_constant, use_symmetry=self.use_symmetry, solver=self.solver)
+        self.reused_visits = tree.visits()
+        size = tree.size
+        self.search_start = time.time()
+        rollout = self.rollout_function()
+        if self.deadline is None:
+            tree.run(self.num_simulations - self.reused_visits, rollout, remaining=self.remaining_simulations)
+        else:
+            tree.run(math.inf, rollout, self.deadline, self.remaining_simulations)
+        self.simulations = tree.visits() - self.reused_visits
+        self.new_nodes = tree.size - size
+        self.tree_size = tree.size
+        return tree
+    
+    def node_decided(self, root: TreeNode) -> bool:
+        """
+        Whether the root is proven, or the remaining budget cannot change most_visited_child().
+        """
+        if root.proof is not None:
+            return True
+        visits = sorted((child.N for child in root.children if child.proof != LOSE), reverse=True)
+        return len(visits) < 2 or visits[0] - visits[1] > self.remaining_simulations(root.N)
+    
+    def remaining_simulations(self, root_visits) -> float:
+        """
+        Root visits left in the budget. In the anytime mode they are estimated from the simulations per second so far,
+        once MIN_RATE_SIMULATIONS new simulations have run; before that the budget counts as unlimited.
+        """
+        if self.deadline is None:
+            return self.num_simulations - root_visits
+        new_visits = root_visits - self.reused_visits
+        now = time.time()
+        if new_visits < MIN_RATE_SIMULATIONS or now <= self.search_start:
+            return math.inf
+        return new_visits / (now - self.search_start) * max(self.deadline - now, 0.0)
+    
+    def searching(self, root_visits) -> bool:
+        """
+        Whether the search goes on: until the root has num_simulations visits, or until the deadline in the anytime mode.
+        """
+        if self.deadline is None:
+            return root_visits < self.num_simulations
+        return time.time() < self.deadline
+    
+    def rollout_function(self):
+        """
+        Function playing several rollouts from a leaf for the searches, or None for one rollout per leaf.
+        """
+        if self.workers > 1:
+            return self.leaf_parallel_rollouts
+        if self.rollouts > 1:
+            return self.batch_rollouts
+        return None
+    
+    def batch_rollouts(self, game):
+        """
+        Play self.rollouts random rollouts from the leaf. On Tic Tac Toe they are played at once by BatchTicTacToe.
+        :return: (sum of the results for the player to move at the leaf, number of rollouts)
+        """
+        if not isinstance(game, TicTacToe):
+            leaf = TreeNode(game, game.curr_player)
+            return sum(leaf.simulate() for _ in range(self.rollouts)), self.rollouts
+        if self.batch is None:
+            self.batch = BatchTicTacToe(self.rollouts, auto_reset=False)
+        self.batch.load(game)
+        winners = self.batch.random_playouts()
+        player = STONES[game.curr_player]
+        return int(np.count_nonzero(winners == player)) - int(np.count_nonzero(winners == 3 - player)), self.rollouts
+    
+    def root_visits(self, game):
+        """
+        Search the position and return the visit counts of the root's children by move.
+        """
+        if self.engine in TREES:
+            return self.tree_search(game).root_visits()
+        root = self.node_search(game)
+        visits = {}
+        for child in root.children:
+            # Proven children count as all or none of the visits, so that the merge agrees with most_visited_child()
+            visits[child.parent_action] = root.N + 1 if child.proof == WIN else 0 if child.proof == LOSE else child.N
+        return visits
+    
+    def start_pool(self) -> ProcessPoolExecutor:
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        return self.pool
+    
+    def root_parallel_move(self, game):
+        """
+        Root parallelism: independent trees in the worker processes, merged by adding up the visits of the root's children.
+        """
+        pool = self.start_pool()
+        code = encode(game)
+        share = -(-self.num_simulations // self.workers)
+        futures = [pool.submit(_root_visits, code, self.letter, share, self.use_symmetry, self.engine, self.rollouts, self.deadline, self.solver,
+                               self.rave, self.rave_equivalence)
+                   for _ in range(self.workers)]
+        visits = {}
+        self.simulations = self.new_nodes = self.tree_size = 0
+        for future in futures:
+            root_visits, simulations, new_nodes, tree_size = future.result()
+            for move, count in root_visits.items():
+                visits[move] = visits.get(move, 0) + count
+            self.simulations += simulations
+            self.new_nodes += new_nodes
+            self.tree_size += tree_size
+        return max(visits, key=visits.get)
+    
+    def leaf_parallel_rollouts(self, game):
+        """
+        Leaf parallelism: every worker plays leaf_batch rollouts from the leaf.
+        :return: (sum of the results for the player to move at the leaf, number of rollouts)
+        """
+        pool = self.start_pool()
+        code = encode(game)
+        futures = [pool.submit(_leaf_rollouts, code, self.leaf_batch) for _ in range(self.workers)]
+        return sum(future.result() for future in futures), self.workers * self.leaf_batch
+    
+    def close(self):
+        """
+        Shut down the worker processes of the parallel modes.
+        """
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+    
+    def __str__(self) -> str:
+        return "MCTS Player"
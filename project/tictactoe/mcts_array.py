@@ -0,0 +1,279 @@
+"""
+This module contains an array-backed MCTS tree for TTT_MCTSPlayer(engine='array').
+* The statistics of all nodes live in preallocated NumPy arrays (struct of arrays) instead of one TreeNode object per node.
+  A node is an index; its children are stored next to each other, from first_child[node] to first_child[node] + num_children[node].
+* The arrays grow by NODE_CHUNK nodes when they are full.
+* Selection computes UCB1 for all children of a node in one vector operation. Backpropagation walks the short path in a plain loop.
+* The root is an index too, so the tree is reused for the next move by moving the root down (descend, descend_to).
+* The search follows TreeNode: Q[node] is from the perspective of the player who moved into the node, and rollouts start from the leaf.
+* With the solver, proof[node] holds the proven result (1, 0 or -1) for the player who moved into the node, as TreeNode.proof.
+"""
+import math
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+
+from ..game import TicTacToe
+from ..symmetry import unique_moves
+
+NODE_CHUNK = 4096
+UNEXPANDED = -1
+UNPROVEN = 2 # proof of nodes without a proven result
+
+class ArrayTree():
+    def __init__(self, game_state: TicTacToe, exploration_constant: float, use_symmetry: bool = False, solver: bool = False):
+        """
+        :param game_state: private copy of the game, positioned at the root. The whole tree shares it.
+        :param exploration_constant: c of UCB1
+        :param use_symmetry: expand one child per class of symmetric moves
+        :param solver: prove game-over nodes and propagate the proofs up the tree (MCTS-Solver), see TTT_MCTSPlayer
+        """
+        self.game_state = game_state
+        self.c = exploration_constant
+        self.use_symmetry = use_symmetry
+        self.solver = solver
+        self.n = game_state.n
+        self.capacity = 0
+        self.N = np.zeros(0, dtype=np.float64)
+        self.Q = np.zeros(0, dtype=np.float64)
+        self.parent = np.zeros(0, dtype=np.int32)
+        self.first_child = np.zeros(0, dtype=np.int32)
+        self.num_children = np.zeros(0, dtype=np.int32)
+        self.num_tried = np.zeros(0, dtype=np.int32) # Children visited at least once; they are tried in move order
+        self.move = np.zeros(0, dtype=np.int32) # Cell x * n + y of the move from the parent
+        self.proof = np.zeros(0, dtype=np.int8)
+        self.size = 1
+        self.root = 0 # Moves down the tree when the tree is reused for the next move, see advance()
+        self._grow(1)
+        self.parent[0] = -1
+        self.move[0] = -1
+
+    def _grow(self, needed: int):
+        """
+        Make room for at least the given number of nodes, in steps of NODE_CHUNK.
+        """
+        if needed <= self.capacity:
+            return
+        extra = -(-(needed - self.capacity) // NODE_CHUNK) * NODE_CHUNK
+        self.capacity += extra
+        self.N = np.concatenate((self.N, np.zeros(extra, dtype=np.float64)))
+        self.Q = np.concatenate((self.Q, np.zeros(extra, dtype=np.float64)))
+        self.parent = np.concatenate((self.parent, np.zeros(extra, dtype=np.int32)))
+        self.first_child = np.concatenate((self.first_child, np.full(extra, UNEXPANDED, dtype=np.int32)))
+        self.num_children = np.concatenate((self.num_children, np.zeros(extra, dtype=np.int32)))
+        self.num_tried = np.concatenate((self.num_tried, np.zeros(extra, dtype=np.int32)))
+        self.move = np.concatenate((self.move, np.zeros(extra, dtype=np.int32)))
+        self.proof = np.concatenate((self.proof, np.full(extra, UNPROVEN, dtype=np.int8)))
+
+    def select(self) -> List[int]:
+        """
+        Follow the child with the best UCB1 value from the root until an unexpanded node, pushing the moves on the shared game.
+        Unvisited children come first, in move order.
+        :return: the path of node indices from the root to the leaf
+        """
+        node = self.root
+        path = [node]
+        game, n, c = self.game_state, self.n, self.c
+        N, Q, first_child, num_children, num_tried = self.N, self.Q, self.first_child, self.num_children, self.num_tried
+        while True:
+            start = int(first_child[node])
+            count = int(num_children[node])
+            if start == UNEXPANDED or not count:
+                break
+            tried = int(num_tried[node])
+            if tried < count:
+                num_tried[node] = tried + 1
+                node = start + tried
+            else:
+                visits = N[start:start + count]
+                ucb = Q[start:start + count] / visits + c * np.sqrt(math.log(N[node]) / visits)
+                if self.solver:
+                    ucb[self.proof[start:start + count] != UNPROVEN] = -np.inf # Proven children are not searched any more
+                node = start + int(ucb.argmax())
+            cell = int(self.move[node])
+            game.push((cell // n, cell % n))
+            path.append(node)
+        return path
+
+    def expand(self, node: int):
+        """
+        Add the children of a node for every legal move (none if the game is over at the node).
+        """
+        game = self.game_state
+        if game.game_over():
+            moves = []
+        else:
+            moves = unique_moves(game) if self.use_symmetry else game.empty_cells()
+        self._grow(self.size + len(moves))
+        start = self.size
+        end = start + len(moves)
+        self.first_child[node] = start
+        self.num_children[node] = len(moves)
+        self.parent[start:end] = node
+        self.move[start:end] = [x * self.n + y for x, y in moves]
+        self.size = end
+
+    def simulate(self) -> int:
+        """
+        Play random moves from the shared game until the game is over, then undo them.
+        :return: 1 if the player to move at the leaf wins, -1 if it loses, 0 for a draw
+        """
+        game = self.game_state
+        player = game.curr_player
+        num_moves = 0
+        while not game.game_over():
+            game.push(random.choice(game.empty_cells()))
+            num_moves += 1
+        if game.winner is None:
+            result = 0
+        elif game.winner == player:
+            result = 1
+        else:
+            result = -1
+        for _ in range(num_moves):
+            game.pop()
+        return result
+
+    def backpropagate(self, path: List[int], result: float, visits: int = 1):
+        """
+        Add the visits and the result, alternating in sign, to every node of the path, and pop the moves select() pushed.
+        :param result: result, or sum of the results of several rollouts, for the player who moved into the leaf
+        :param visits: number of rollouts in result
+        """
+        # A plain loop: the path is a few nodes long, too short to pay for building an index array
+        N, Q = self.N, self.Q
+        for node in reversed(path):
+            N[node] += visits
+            Q[node] += result
+            result = -result
+        for _ in range(len(path) - 1):
+            self.game_state.pop()
+
+    def run(self, num_simulations: float, rollout: Optional[Callable[[TicTacToe], Tuple[float, int]]] = None,
+            deadline: Optional[float] = None, remaining: Optional[Callable[[float], float]] = None):
+        """
+        Run select, expand, simulate and backpropagate until the root has num_simulations more visits.
+        :param rollout: function playing rollouts from an unfinished leaf, returning (sum of the results, number of rollouts).
+            None plays one rollout with simulate().
+        :param deadline: time.time() at which to stop early. The root is expanded even if it has passed.
+        :param remaining: function of the root visits returning the visits left in the budget. With the solver, the search stops
+            when the root is proven or its most visited child can no longer be overtaken.
+        """
+        target = self.N[self.root] + num_simulations
+        while self.N[self.root] < target:
+            if self.first_child[self.root] != UNEXPANDED:
+                if deadline is not None and time.time() >= deadline:
+                    break
+                if self.solver and remaining is not None and self.decided(remaining(self.N[self.root])):
+                    break
+            path = self.select()
+            leaf = path[-1]
+            if self.game_state.game_over():
+                result, visits = self.simulate(), 1
+                if self.solver:
+                    self.proof[leaf] = -result
+            else:
+                self.expand(leaf)
+                result, visits = rollout(self.game_state) if rollout is not None else (self.simulate(), 1)
+            self.backpropagate(path, -result, visits) # Negate the result because it's from the perspective of the opponent
+            if self.proof[leaf] != UNPROVEN:
+                for node in reversed(path[:-1]):
+                    if not self.prove(node):
+                        break
+    
+    def prove(self, node: int) -> bool:
+        """
+        Prove a node from its children, as TreeNode.prove().
+        :return: whether the node is proven
+        """
+        start = int(self.first_child[node])
+        proofs = self.proof[start:start + self.num_children[node]]
+        if (proofs == 1).any():
+            self.proof[node] = -1
+        elif (proofs == UNPROVEN).any():
+            return False
+        else:
+            self.proof[node] = -proofs.max()
+        return True
+    
+    def decided(self, remaining: float) -> bool:
+        """
+        Whether the root is proven, or the remaining visits cannot change best_child().
+        """
+        if self.proof[self.root] != UNPROVEN:
+            return True
+        start = int(self.first_child[self.root])
+        end = start + int(self.num_children[self.root])
+        visits = self.N[start:end][self.proof[start:end] != -1]
+        if len(visits) < 2:
+            return True
+        second, first = np.partition(visits, -2)[-2:]
+        return first - second > remaining
+
+    def best_child(self) -> int:
+        """
+        Most visited child of the root. With the solver, a proven win comes first and proven losses come last.
+        """
+        start = int(self.first_child[self.root])
+        return start + int(np.argmax(self.solved_visits()))
+    
+    def solved_visits(self) -> np.ndarray:
+        """
+        Visits of the root's children, where proven wins count as more than all visits of the root and proven losses as -1.
+        """
+        start = int(self.first_child[self.root])
+        end = start + int(self.num_children[self.root])
+        visits = self.N[start:end].copy()
+        proofs = self.proof[start:end]
+        visits[proofs == 1] = self.N[self.root] + 1
+        visits[proofs == -1] = -1
+        return visits
+
+    def best_move(self) -> Tuple[int, int]:
+        """
+        Move of the most visited child of the root.
+        """
+        cell = int(self.move[self.best_child()])
+        return cell // self.n, cell % self.n
+
+    def visits(self) -> int:
+        """
+        Visits of the root.
+        """
+        return int(self.N[self.root])
+    
+    def root_visits(self) -> Dict[Tuple[int, int], int]:
+        """
+        Visit counts of the root's children by move.
+        """
+        start = int(self.first_child[self.root])
+        end = start + int(self.num_children[self.root])
+        visits = np.maximum(self.solved_visits(), 0)
+        return {(cell // self.n, cell % self.n): int(count) for cell, count in zip(self.move[start:end].tolist(), visits.tolist())}
+
+    def descend(self, child: int):
+        """
+        Make a child of the root the new root, playing its move on the shared game.
+        The nodes outside the new subtree stay in the arrays until the tree is dropped.
+        """
+        cell = int(self.move[child])
+        self.game_state.push((cell // self.n, cell % self.n))
+        self.root = child
+
+    def descend_to(self, game: TicTacToe) -> bool:
+        """
+        Make the child of the root that reaches the position of game the new root.
+        :return: False if there is no such child
+        """
+        shared, root = self.game_state, self.root
+        start = int(self.first_child[root])
+        if start == UNEXPANDED:
+            return False
+        for child in range(start, start + int(self.num_children[root])):
+            self.descend(child)
+            if shared.hash_key == game.hash_key:
+                return True
+            shared.pop()
+        self.root = root
+        return False
@@ -0,0 +1,265 @@
+"""
+This module contains a transposition-aware MCTS for TTT_MCTSPlayer(engine='dag').
+* The search graph is a directed acyclic graph: the statistics of a position live in one DagNode, stored in a table keyed by
+  the Zobrist hash key of the position, so every move order that reaches the same board shares its visits and value.
+* A node keeps the visits of each of its moves (edges) as well. UCB1 combines the value of the child, learned on every path
+  into it, with the visits of the edge from this parent, so a child reached through another parent still gets explored here.
+* A simulation is backpropagated along the path it took, not to all parents of the leaf. Every node on the path gains
+  the visit once and the visits of the edges on the path grow with it, so no statistic is counted twice.
+* The table outlives a move: the next search starts from the current position in the same table, whatever the moves in between.
+* The search otherwise follows TreeNode and ArrayTree: Q is from the perspective of the player who moved into the node,
+  rollouts start from the leaf, and the solver proofs use WIN = 1, DRAW = 0, LOSE = -1.
+"""
+import math
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..game import TicTacToe
+from ..symmetry import unique_moves
+
+class DagNode():
+    __slots__ = ('N', 'Q', 'moves', 'children', 'edge_N', 'tried', 'proof')
+
+    def __init__(self):
+        self.N = 0
+        self.Q = 0
+        self.moves = None # Legal moves, set on expansion; empty if the game is over
+        self.children = None # DagNode of every move, looked up in the table when the move is first tried
+        self.edge_N = None # Visits of every move from this node
+        self.tried = 0 # Moves tried at least once; they are tried in move order
+        self.proof = None # Proven WIN, DRAW or LOSE for the player who moved into this node, None if unknown
+
+class DagTree():
+    def __init__(self, game_state: TicTacToe, exploration_constant: float, use_symmetry: bool = False, solver: bool = False):
+        """
+        :param game_state: private copy of the game, positioned at the root. The whole graph shares it.
+        :param exploration_constant: c of UCB1
+        :param use_symmetry: expand one child per class of symmetric moves
+        :param solver: prove game-over nodes and propagate the proofs (MCTS-Solver), see TTT_MCTSPlayer
+        """
+        self.game_state = game_state
+        self.c = exploration_constant
+        self.use_symmetry = use_symmetry
+        self.solver = solver
+        self.nodes: Dict[int, DagNode] = {}
+        self.root = self.node(game_state.hash_key)
+
+    @property
+    def size(self) -> int:
+        return len(self.nodes)
+
+    def node(self, key: int) -> DagNode:
+        """
+        Node of a position by hash key, created on first use.
+        """
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = DagNode()
+        return node
+
+    def select(self) -> Tuple[List[DagNode], List[int]]:
+        """
+        Follow the move with the best UCB1 value from the root until an unexpanded, game-over or proven node,
+        pushing the moves on the shared game. Untried moves come first, in move order.
+        :return: the path of nodes from the root to the leaf, and the index of the move taken at every node but the leaf
+        """
+        node = self.root
+        path, edges = [node], []
+        game, c, solver = self.game_state, self.c, self.solver
+        while node.moves and node.proof is None:
+            if node.tried < len(node.moves):
+                i = node.tried
+                node.tried += 1
+            else:
+                log_n = math.log(node.N)
+                best = -math.inf
+                i = -1
+                for j, child in enumerate(node.children):
+                    if solver and child.proof is not None:
+                        continue # Proven children are not searched any more
+                    ucb = child.Q / child.N + c * math.sqrt(log_n / node.edge_N[j])
+                    if ucb > best:
+                        best, i = ucb, j
+                if i < 0:
+                    # All children were proven through other parents
+                    self.prove(node)
+                    break
+            game.push(node.moves[i])
+            if node.children[i] is None:
+                node.children[i] = self.node(game.hash_key)
+            edges.append(i)
+            node = node.children[i]
+            path.append(node)
+        return path, edges
+
+    def expand(self, node: DagNode):
+        """
+        Add the moves of a node (none if the game is over at the node).
+        """
+        game = self.game_state
+        if game.game_over():
+            node.moves = []
+        else:
+            node.moves = unique_moves(game) if self.use_symmetry else game.empty_cells()
+        node.children = [None] * len(node.moves)
+        node.edge_N = [0] * len(node.moves)
+
+    def simulate(self) -> int:
+        """
+        Play random moves from the shared game until the game is over, then undo them.
+        :return: 1 if the player to move at the leaf wins, -1 if it loses, 0 for a draw
+        """
+        game = self.game_state
+        player = game.curr_player
+        num_moves = 0
+        while not game.game_over():
+            game.push(random.choice(game.empty_cells()))
+            num_moves += 1
+        if game.winner is None:
+            result = 0
+        elif game.winner == player:
+            result = 1
+        else:
+            result = -1
+        for _ in range(num_moves):
+            game.pop()
+        return result
+
+    def backpropagate(self, path: List[DagNode], edges: List[int], result: float, visits: int = 1):
+        """
+        Add the visits and the result, alternating in sign, to the nodes and edges of the path, and pop the moves select() pushed.
+        :param result: result, or sum of the results of several rollouts, for the player who moved into the leaf
+        :param visits: number of rollouts in result
+        """
+        for node in reversed(path):
+            node.N += visits
+            node.Q += result
+            result = -result
+        for node, i in zip(path, edges):
+            node.edge_N[i] += visits
+            self.game_state.pop()
+
+    def run(self, num_simulations: float, rollout: Optional[Callable[[TicTacToe], Tuple[float, int]]] = None,
+            deadline: Optional[float] = None, remaining: Optional[Callable[[float], float]] = None):
+        """
+        Run select, expand, simulate and backpropagate until the root has num_simulations more visits, as ArrayTree.run().
+        """
+        root = self.root
+        target = root.N + num_simulations
+        while root.N < target:
+            if root.moves is not None:
+                if deadline is not None and time.time() >= deadline:
+                    break
+                if self.solver and remaining is not None and self.decided(remaining(root.N)):
+                    break
+            path, edges = self.select()
+            leaf = path[-1]
+            if leaf.proof is not None:
+                # A proven position reached through another parent. Its proof is its result.
+                result, visits = -leaf.proof, 1
+            elif self.game_state.game_over():
+                if leaf.moves is None:
+                    self.expand(leaf)
+                result, visits = self.simulate(), 1
+                if self.solver:
+                    leaf.proof = -result
+            else:
+                if leaf.moves is None:
+                    self.expand(leaf)
+                result, visits = rollout(self.game_state) if rollout is not None else (self.simulate(), 1)
+            self.backpropagate(path, edges, -result, visits) # Negate the result because it's from the perspective of the opponent
+            if leaf.proof is not None:
+                for node in reversed(path[:-1]):
+                    if not self.prove(node):
+                        break
+
+    def prove(self, node: DagNode) -> bool:
+        """
+        Prove a node from its children, as TreeNode.prove(). Moves that were never tried are unproven.
+        :return: whether the node is proven
+        """
+        best = -1
+        for child in node.children:
+            if child is None or child.proof is None:
+                best = None
+            elif child.proof == 1:
+                node.proof = -1
+                return True
+            elif best is not None:
+                best = max(best, child.proof)
+        if best is None:
+            return False
+        node.proof = -best
+        return True
+
+    def decided(self, remaining: float) -> bool:
+        """
+        Whether the root is proven, or the remaining visits cannot change best_child().
+        """
+        if self.root.proof is not None:
+            return True
+        visits = sorted((count for count in self.solved_visits() if count >= 0), reverse=True)
+        return len(visits) < 2 or visits[0] - visits[1] > remaining
+
+    def solved_visits(self) -> List[int]:
+        """
+        Visits of the root's children, where proven wins count as more than all visits of the children and proven losses as -1.
+        A child can have more visits than the root, from the paths through its other parents.
+        """
+        total = sum(child.N for child in self.root.children if child is not None) + 1
+        visits = []
+        for child in self.root.children:
+            if child is None:
+                visits.append(0)
+            elif child.proof == 1:
+                visits.append(total)
+            elif child.proof == -1:
+                visits.append(-1)
+            else:
+                visits.append(child.N)
+        return visits
+
+    def visits(self) -> int:
+        """
+        Visits of the root.
+        """
+        return self.root.N
+
+    def best_child(self) -> int:
+        """
+        Index of the most visited move of the root. With the solver, a proven win comes first and proven losses come last.
+        Children count their visits on all paths into them.
+        """
+        visits = self.solved_visits()
+        return max(range(len(visits)), key=visits.__getitem__)
+
+    def best_move(self) -> Tuple[int, int]:
+        """
+        Most visited move of the root.
+        """
+        x, y = self.root.moves[self.best_child()]
+        return x, y
+
+    def root_visits(self) -> Dict[Tuple[int, int], int]:
+        """
+        Visit counts of the root's children by move.
+        """
+        return {(x, y): max(count, 0) for (x, y), count in zip(self.root.moves, self.solved_visits())}
+
+    def descend(self, child: int):
+        """
+        Make the position after a move of the root the new root, playing the move on the shared game.
+        """
+        self.game_state.push(self.root.moves[child])
+        self.root = self.node(self.game_state.hash_key)
+
+    def descend_to(self, game: TicTacToe) -> bool:
+        """
+        Make the position of game the new root. The table keeps every position, so this always succeeds:
+        statistics of the position are reused however it was reached.
+        """
+        if self.game_state.hash_key != game.hash_key:
+            self.game_state = game.copy()
+        self.root = self.node(game.hash_key)
+        return True
@@ -1,89 +1,135 @@
-"""
-TODO: Implement the TTT_MinimaxPlayer class.
-* Note 1: You should read the game logic in project/game.py to familiarize yourself with the environment.
-* Note 2: You don't have to strictly follow the template or even use it at all. Feel free to create your own implementation.
-"""
-
-from typing import List, Tuple, Union
-import random
-import math
-from ..player import Player
-from ..game import TicTacToe
-
-class TTT_MinimaxPlayer(Player):
-    def __init__(self, letter):
-        super().__init__(letter)
-
-    def get_move(self, game: TicTacToe) -> Union[List[int], Tuple[int, int]]:
-        depth = len(game.empty_cells())
-        
-        if depth == 9:
-            move = random.choice(list(game.empty_cells())) # Random move if it's the first move
-        else:
-            move = self.minimax(game, depth, self.letter)
-        
-        return move
-
-    def minimax(self, game: TicTacToe, depth: int, player_letter: str) -> Union[List[int], Tuple[int, int]]:
-        """
-        Minimax algorithm that chooses the best move
-        :param game: current game state
-        :param depth: node index in the tree (0 <= depth <= 9), but never 9 in this case
-        :param player_letter: value representing the player
-        :return: [row, col, best_score] of the selected move
-        """
-        opponent = "O" if player_letter == "X" else "X"
-        
-        if game.game_over() or depth == 0:
-            return [-1, -1, self.evaluate(game)]
-        
-        
-        if player_letter == self.letter:
-            best_score = -math.inf
-            best = [-1, -1, best_score]
-            
-            for cell in game.empty_cells(state=game.board_state):
-                next_x, next_y = cell
-                temp_game = game.copy()
-                temp_game.set_move(next_x, next_y, player_letter)
-                _, _, score = self.minimax(temp_game, depth - 1, opponent)
-                
-                if score > best_score:
-                    best_score = score
-                    best = [next_x, next_y, best_score]
-            return best                
-        else:
-            best_score = math.inf
-            best = [-1, -1, best_score]
-            
-            for cell in game.empty_cells(state=game.board_state):
-                next_x, next_y = cell
-                temp_game = game.copy()
-                temp_game.set_move(next_x, next_y, player_letter)
-                _, _, score = self.minimax(temp_game, depth - 1, opponent)
-                
-                if score < best_score:
-                    best_score = score
-                    best = [next_x, next_y, best_score]
-                
-            return best
-        
-        
-    def evaluate(self, game: TicTacToe) -> int:
-        """
-        Function to evaluate the score of game state.
-        :param game: the game state to evaluate
-        :return: the score of the board from the perspective of current player
-        """
-        
-        if game.wins(self.letter):
-            return 1
-        
-        opponent = "O" if self.letter == "X" else "X"
-        if game.wins(opponent):
-            return -1
-        
-        return 0
-    
-    def __str__(self) -> str:
+"""
+TODO: Implement the TTT_MinimaxPlayer class.
+* Note 1: You should read the game logic in project/game.py to familiarize yourself with the environment.
+* Note 2: You don't have to strictly follow the template or even use it at all. Feel free to create your own implementation.
+"""
+
+from typing import List, Tuple, Union
+import random
+import math
+from ..player import Player
+from ..game import TicTacToe, MNKGame
+from ..evaluation import PatternEvaluator
+from ..symmetry import unique_moves, canonicalize
+from .oracle import load_table, lookup
+
+class TTT_MinimaxPlayer(Player):
+    def __init__(self, letter, use_symmetry=False, oracle=False, max_depth=None):
+        super().__init__(letter)
+        self.max_depth = max_depth # Maximum search depth in moves, None searches to the end of the game
+        self.use_symmetry = use_symmetry # Search one move per class of symmetric moves
+        self.oracle = oracle # Answer from the perfect-play table instead of searching
+        self.memo = {} # Negamax value of every searched (position, depth), for the player to move; see negamax()
+        if self.oracle:
+            load_table()
+
+    def get_move(self, game: TicTacToe) -> Union[List[int], Tuple[int, int]]:
+        depth = len(game.empty_cells())
+        
+        if depth == 9:
+            move = random.choice(list(game.empty_cells())) # Random move if it's the first move
+        elif self.oracle:
+            # The first best move in row-major order is the move the full search would choose
+            value, moves = lookup(game)
+            move = [moves[0][0], moves[0][1], value]
+        else:
+            if self.max_depth is not None:
+                depth = min(depth, self.max_depth)
+            # Search on one private copy; minimax() plays and undoes moves on it in place
+            search_game = game.copy()
+            if isinstance(search_game, MNKGame):
+                # Score positions at the depth limit incrementally by their patterns
+                search_game.evaluator = PatternEvaluator(search_game)
+            move = self.minimax(search_game, depth, self.letter)
+        
+        return move
+
+    def minimax(self, game: TicTacToe, depth: int, player_letter: str) -> Union[List[int], Tuple[int, int]]:
+        """
+        Minimax algorithm that chooses the best move, in negamax form: the root takes the first move with the best value.
+        :param game: current game state
+        :param depth: node index in the tree (0 <= depth <= 9), but never 9 in this case
+        :param player_letter: value representing the player
+        :return: [row, col, best_score] of the selected move
+        """
+        if game.game_over() or depth == 0:
+            return [-1, -1, self.evaluate(game)]
+        
+        opponent = "O" if player_letter == "X" else "X"
+        best = [-1, -1, -math.inf]
+        for cell in self.moves(game):
+            next_x, next_y = cell
+            game.push(cell)
+            score = -self.negamax(game, depth - 1, opponent)
+            game.pop()
+            
+            if score > best[2]:
+                best = [next_x, next_y, score]
+        return best
+        
+    def negamax(self, game: TicTacToe, depth: int, player_letter: str) -> float:
+        """
+        Value of the game state for the player to move, memoised by position and remaining depth.
+        The position is the hash key, or with use_symmetry the canonical key, so symmetric positions share one entry.
+        The memo is kept for the lifetime of the player, so later moves of a game are answered from it.
+        :param game: current game state
+        :param depth: remaining depth
+        :param player_letter: value representing the player to move
+        :return: 1 if the player to move wins, -1 if it loses, 0 for a draw (or the pattern evaluation at the depth limit)
+        """
+        key = (canonicalize(game)[0] if self.use_symmetry else game.hash_key, depth)
+        value = self.memo.get(key)
+        if value is not None:
+            return value
+        
+        if game.winner is not None:
+            value = -1 # The player who just moved has won
+        elif game.game_over():
+            value = 0
+        elif depth == 0:
+            value = self.evaluate(game)
+            if player_letter != self.letter:
+                value = -value
+        else:
+            opponent = "O" if player_letter == "X" else "X"
+            value = -math.inf
+            for cell in self.moves(game):
+                game.push(cell)
+                score = -self.negamax(game, depth - 1, opponent)
+                game.pop()
+                if score > value:
+                    value = score
+        self.memo[key] = value
+        return value
+        
+    def moves(self, game: TicTacToe) -> List[List[int]]:
+        """
+        Moves to search from the game state, in row-major order.
+        """
+        if self.use_symmetry:
+            return unique_moves(game)
+        if game.evaluator is not None:
+            return game.evaluator.candidate_moves(game)
+        return game.empty_cells()
+        
+    def evaluate(self, game: TicTacToe) -> float:
+        """
+        Function to evaluate the score of game state.
+        :param game: the game state to evaluate
+        :return: the score of the board from the perspective of current player.
+            +-1 for a win or loss, otherwise the pattern evaluation in (-1, 1) if the game has an evaluator, or 0
+        """
+        
+        if game.wins(self.letter):
+            return 1
+        
+        opponent = "O" if self.letter == "X" else "X"
+        if game.wins(opponent):
+            return -1
+        
+        if game.evaluator is not None:
+            return game.evaluator.evaluate(self.letter)
+        return 0
+    
+    def __str__(self) -> str:
         return "Minimax Player"
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+This module contains the perfect-play table for Tic Tac Toe and the TTT_OraclePlayer that plays from it.
+* solve() enumerates every reachable position once (5,478 of them) and scores it with negamax.
+* The table has one uint16 per base-3 code of project/encoding.py (3**9 entries, about 39 kB on disk):
+    bit 15: the position is reachable, bits 9-10: value + 1 for the player to move (-1 loss, 0 draw, 1 win),
+    bits 0-8: mask of the best moves, bit 3*x + y for move (x, y).
+* The table is written to disk once and then memory-mapped, so a lookup is a single array read.
+"""
+import os
+import random
+from typing import List, Tuple
+import numpy as np
+
+from ..player import Player
+from ..game import TicTacToe
+from ..encoding import encode, NUM_TTT_STATES
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'perfect_play.npy')
+
+REACHABLE = 1 << 15
+VALUE_SHIFT = 9
+MOVES_MASK = 0b111111111
+
+_table = None
+
+def solve() -> np.ndarray:
+    """
+    Solve Tic Tac Toe by enumerating every position reachable from the empty board.
+    :return: the perfect-play table
+    """
+    table = np.zeros(NUM_TTT_STATES, dtype=np.uint16)
+    game = TicTacToe()
+
+    def negamax() -> int:
+        code = encode(game)
+        if table[code]:
+            return (int(table[code]) >> VALUE_SHIFT & 0b11) - 1
+
+        if game.winner is not None:
+            value, best_moves = -1, 0 # The player who just moved has won
+        elif game.game_over():
+            value, best_moves = 0, 0
+        else:
+            value, best_moves = -2, 0
+            for x, y in game.empty_cells():
+                game.push((x, y))
+                score = -negamax()
+                game.pop()
+                if score > value:
+                    value, best_moves = score, 0
+                if score == value:
+                    best_moves |= 1 << (3*x + y)
+        table[code] = REACHABLE | (value + 1) << VALUE_SHIFT | best_moves
+        return value
+
+    negamax()
+    return table
+
+def write_table(path: str = TABLE_PATH) -> np.ndarray:
+    """
+    Solve the game and write the table to disk.
+    """
+    table = solve()
+    np.save(path, table)
+    return table
+
+def load_table(path: str = TABLE_PATH) -> np.ndarray:
+    """
+    Memory-map the table from disk, writing it first if the file does not exist yet. The table is loaded once per process.
+    """
+    global _table
+    if _table is None:
+        if not os.path.exists(path):
+            write_table(path)
+        _table = np.load(path, mmap_mode='r')
+    return _table
+
+def lookup(game: TicTacToe) -> Tuple[int, List[List[int]]]:
+    """
+    Look up the current position of a game.
+    :param game: Tic Tac Toe game
+    :return: (value for the player to move, best moves in row-major order)
+    """
+    entry = int(load_table()[encode(game)])
+    if not entry & REACHABLE:
+        raise ValueError("The position is not reachable in a legal game of Tic Tac Toe")
+    value = (entry >> VALUE_SHIFT & 0b11) - 1
+    moves = [[i // 3, i % 3] for i in range(9) if entry >> i & 1]
+    return value, moves
+
+class TTT_OraclePlayer(Player):
+    def __init__(self, letter):
+        super().__init__(letter)
+        load_table()
+
+    def get_move(self, game: TicTacToe):
+        """
+        Play a random one of the best moves of the perfect-play table.
+        """
+        _, moves = lookup(game)
+        return random.choice(moves)
+
+    def __str__(self) -> str:
+        return "Oracle Player"
+
+if __name__ == '__main__':
+    table = write_table()
+    print(f"Wrote {np.count_nonzero(table & REACHABLE)} positions to {TABLE_PATH}")
@@ -0,0 +1,78 @@
+"""
+This module contains a bounded transposition table for the search players, keyed by the games' Zobrist hash_key.
+"""
+from typing import Optional, Tuple
+
+# Bound types of a stored value
+EXACT = 0
+LOWER = 1 # the value is a lower bound (the search failed high)
+UPPER = 2 # the value is an upper bound (the search failed low)
+
+TT_SIZE = 2 ** 16
+
+class TranspositionTable():
+    def __init__(self, size: int = TT_SIZE):
+        """
+        Fixed number of slots indexed by the low bits of the hash key.
+        Replacement policy: a slot is overwritten if it is empty, holds the same position, was written by an
+        earlier search (see new_search), or the new entry was searched at least as deep. Otherwise the deeper entry is kept.
+        :param size: number of slots, a power of two
+        """
+        if size <= 0 or size & (size - 1):
+            raise ValueError(f"Transposition table size must be a power of two, got {size}")
+        self.size = size
+        self.mask = size - 1
+        self.slots = [None] * size # (key, value, depth, best_move, flag, generation)
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.used = 0
+
+    def new_search(self):
+        """
+        Mark the start of a new root search, so entries from earlier searches become preferred for replacement.
+        """
+        self.generation += 1
+
+    def lookup(self, key: int) -> Optional[Tuple[float, int, Optional[Tuple[int, int]], int]]:
+        """
+        Get the entry stored for a position.
+        :param key: hash_key of the position
+        :return: (value, depth, best_move, flag) or None if the position is not stored
+        """
+        slot = self.slots[key & self.mask]
+        if slot is not None and slot[0] == key:
+            self.hits += 1
+            return slot[1], slot[2], slot[3], slot[4]
+        self.misses += 1
+        return None
+
+    def store(self, key: int, value: float, depth: int, best_move: Optional[Tuple[int, int]], flag: int):
+        """
+        Store the search result of a position, subject to the replacement policy.
+        :param key: hash_key of the position
+        :param value: score from the perspective of the player to move
+        :param depth: remaining depth the position was searched to
+        :param best_move: best move found, if any
+        :param flag: EXACT, LOWER or UPPER
+        """
+        index = key & self.mask
+        slot = self.slots[index]
+        if slot is None:
+            self.used += 1
+        elif slot[0] != key and slot[5] == self.generation and slot[2] > depth:
+            return
+        self.slots[index] = (key, value, depth, best_move, flag, self.generation)
+        self.stores += 1
+
+    def clear(self):
+        self.slots = [None] * self.size
+        self.used = 0
+
+    def hit_rate(self) -> float:
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def __len__(self) -> int:
+        return self.used
@@ -0,0 +1,21 @@
+import pytest
+from project.game import TicTacToe
+
+@pytest.fixture(scope='session')
+def ttt_positions():
+    """
+    Every position reachable in a legal game of Tic Tac Toe, the empty board and finished games included.
+    """
+    positions = {}
+    def visit(game):
+        if game.hash_key in positions:
+            return
+        positions[game.hash_key] = game.copy()
+        if game.game_over():
+            return
+        for cell in game.empty_cells():
+            game.push(tuple(cell))
+            visit(game)
+            game.pop()
+    visit(TicTacToe())
+    return list(positions.values())
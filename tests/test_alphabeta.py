@@ -0,0 +1,20 @@
+import pytest
+from project.tictactoe import TTT_AlphaBetaPlayer
+from project.tictactoe.oracle import lookup
+
+CONFIGURATIONS = {
+    'default': {},
+    'small table': {'tt_size': 64}, # Entries are replaced all the time, so stored bounds meet other windows
+    'pvs': {'pvs': True},
+    'iterative deepening': {'pvs': True, 'time_limit': 60},
+}
+
+@pytest.mark.parametrize('config', CONFIGURATIONS)
+def test_alphabeta_plays_optimal_moves(config, ttt_positions):
+    # One player per letter, so the transposition table and the move ordering carry over between positions as in a game
+    players = {letter: TTT_AlphaBetaPlayer(letter, **CONFIGURATIONS[config]) for letter in 'XO'}
+    for game in ttt_positions:
+        if game.game_over():
+            continue
+        move = players[game.curr_player].get_move(game.copy())
+        assert list(move) in lookup(game)[1], game.board_state
@@ -0,0 +1,20 @@
+import random
+import pytest
+from project.game import TicTacToe, MNKGame, Gomoku
+from project.encoding import encode, decode
+
+@pytest.mark.parametrize('new_game', [TicTacToe, lambda: MNKGame(3, 3, 3), lambda: MNKGame(1, 9, 3), lambda: Gomoku(7, 5)])
+@pytest.mark.parametrize('num_moves', [0, 1, 4, 9])
+def test_decode_inverts_encode(new_game, num_moves):
+    random.seed(num_moves)
+    game = new_game()
+    for _ in range(num_moves):
+        if game.game_over():
+            break
+        game.push(tuple(random.choice(game.empty_cells())))
+    decoded = decode(encode(game))
+    assert isinstance(decoded, type(game))
+    assert decoded.board_state == game.board_state
+    assert decoded.curr_player == game.curr_player
+    assert decoded.winner == game.winner
+    assert decoded.hash_key == game.hash_key
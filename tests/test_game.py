@@ -0,0 +1,41 @@
+import random
+import pytest
+from project.game import TicTacToe, MNKGame, Gomoku
+
+def status(game):
+    return game.hash_key, game.winner, game.win_combo, game.curr_player, game.num_moves, game.board_state
+
+def test_pop_restores_every_tic_tac_toe_position(ttt_positions):
+    for game in ttt_positions:
+        if game.game_over():
+            continue
+        before = status(game)
+        for cell in game.empty_cells():
+            game.push(tuple(cell))
+            game.pop()
+            assert status(game) == before
+
+@pytest.mark.parametrize('new_game', [lambda: MNKGame(4, 4, 3), lambda: Gomoku(9, 5)])
+def test_pop_restores_m_n_k_positions(new_game):
+    random.seed(0)
+    for _ in range(20):
+        game = new_game()
+        history = [status(game)]
+        while not game.game_over():
+            game.push(tuple(random.choice(game.empty_cells())))
+            history.append(status(game))
+        assert game.winner is None or len(game.win_combo) >= game.k # Free-style: overlines win too
+        while game.move_stack:
+            history.pop()
+            game.pop()
+            assert status(game) == history[-1]
+
+@pytest.mark.parametrize('new_game', [TicTacToe, lambda: MNKGame(3, 3, 3)])
+def test_reset_move_clears_the_undone_win(new_game):
+    game = new_game()
+    for move in [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]:
+        game.set_move(*move, game.curr_player)
+    assert game.winner == 'X' and len(game.win_combo) == 3
+    game.reset_move(0, 2)
+    assert game.winner is None
+    assert game.win_combo == []
@@ -0,0 +1,18 @@
+import random
+
+import pytest
+from project.game import TicTacToe
+from project.tictactoe import TTT_MCTSPlayer
+from project.tictactoe.mcts import ENGINES
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_anytime_search_on_reused_tree_runs_simulations(engine):
+    random.seed(0)
+    player = TTT_MCTSPlayer('X', engine=engine, time_limit=0.01) # A short first search leaves the reused root unproven
+    game = TicTacToe()
+    game.push(tuple(player.get_move(game)))
+    player.time_limit = 0.2
+    game.push(tuple(game.empty_cells()[0]))
+    player.get_move(game)
+    assert player.reused_visits > 0
+    assert player.simulations > 0
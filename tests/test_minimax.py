@@ -0,0 +1,25 @@
+from project.game import TicTacToe
+from project.symmetry import canonicalize
+from project.tictactoe import TTT_MinimaxPlayer
+
+def test_symmetric_memo_holds_one_entry_per_class(ttt_positions):
+    player = TTT_MinimaxPlayer('X', use_symmetry=True)
+    player.minimax(TicTacToe(), 9, 'X')
+    classes = {canonicalize(game)[0] for game in ttt_positions}
+    assert len(classes) == 765
+    assert len(player.memo) == len(classes) - 1 # Every class but the empty board, which is the root
+
+def test_symmetric_search_matches_plain_search(ttt_positions):
+    plain = TTT_MinimaxPlayer('X')
+    symmetric = TTT_MinimaxPlayer('X', use_symmetry=True)
+    for game in ttt_positions:
+        if game.game_over() or game.num_moves == 0:
+            continue
+        plain.letter = symmetric.letter = game.curr_player
+        depth = len(game.empty_cells())
+        expected = plain.minimax(game.copy(), depth, game.curr_player)
+        x, y, score = symmetric.minimax(game.copy(), depth, game.curr_player)
+        assert score == expected[2]
+        game.push((x, y))
+        assert -plain.negamax(game, depth - 1, game.curr_player) == score # The move reaches the same value
+        game.pop()
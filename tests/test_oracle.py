@@ -0,0 +1,18 @@
+from project.tictactoe import TTT_MinimaxPlayer
+from project.tictactoe.oracle import lookup
+
+def test_table_matches_full_minimax(ttt_positions):
+    player = TTT_MinimaxPlayer('X')
+    for game in ttt_positions:
+        value, moves = lookup(game)
+        if game.game_over():
+            assert moves == []
+            continue
+        assert value == player.negamax(game, len(game.empty_cells()), game.curr_player)
+        best = []
+        for cell in game.empty_cells():
+            game.push(tuple(cell))
+            if -player.negamax(game, len(game.empty_cells()), game.curr_player) == value:
+                best.append(cell)
+            game.pop()
+        assert moves == best